@@ -4,16 +4,19 @@
 import re
 import subprocess
 import sys
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import IO
 
-try:
-    import tomli
-except ImportError:
-    try:
-        import tomllib as tomli  # Python 3.11+
-    except ImportError:
-        print("Error: tomli is required. Install with: uv pip install tomli")
-        sys.exit(1)
+# Matches the `version = "..."` assignment inside the [project] table; group 1 is the value.
+_PROJECT_VERSION_RE = re.compile(rb'(?ms)^\[project\][^\[]*?^[ \t]*version[ \t]*=[ \t]*"([^"]+)"')
+_VERSION_LINE_RE = re.compile(r'^\s*version\s*=\s*"')
+_VERSION_VALUE_RE = re.compile(r'(version\s*=\s*")[^"]+(")')
+_SEMVER_TAG_RE = re.compile(r"^v(\d+)\.(\d+)\.(\d+)$")
+_VERSION_FORMAT_RE = re.compile(r"^\d+\.\d+\.\d+")
 
 
 def get_current_version() -> str:
@@ -23,8 +26,13 @@ def get_current_version() -> str:
         print("Error: pyproject.toml not found")
         sys.exit(1)
 
+    # Fast path: a plain `version = "..."` line needs no TOML parse.
+    match = _PROJECT_VERSION_RE.search(pyproject_path.read_bytes())
+    if match:
+        return match.group(1).decode("utf-8")
+
     with open(pyproject_path, "rb") as f:
-        data = tomli.load(f)
+        data = _toml_module().load(f)
 
     version = data.get("project", {}).get("version")
     if not version:
@@ -34,9 +42,41 @@ def get_current_version() -> str:
     return version
 
 
+def _toml_module():
+    """Import a TOML parser only when the regex fast path misses."""
+    try:
+        import tomli
+    except ImportError:
+        try:
+            import tomllib as tomli  # Python 3.11+
+        except ImportError:
+            print("Error: tomli is required. Install with: uv pip install tomli")
+            sys.exit(1)
+    return tomli
+
+
 def update_version(new_version: str) -> None:
     """Update version in pyproject.toml under [project] section only."""
     pyproject_path = Path("pyproject.toml")
+    data = pyproject_path.read_bytes()
+
+    # Fast path: splice the new value into the matched byte span so the rest of
+    # the file (including line endings) is written back untouched.
+    match = _PROJECT_VERSION_RE.search(data)
+    if match:
+        # memoryview slices share the original buffer, so no copy of the file is made.
+        view = memoryview(data)
+        with open(pyproject_path, "wb") as f:
+            f.write(view[: match.start(1)])
+            f.write(new_version.encode("utf-8"))
+            f.write(view[match.end(1) :])
+    else:
+        _update_version_by_lines(pyproject_path, new_version)
+    print(f"✓ Updated version in pyproject.toml to {new_version}")
+
+
+def _update_version_by_lines(pyproject_path: Path, new_version: str) -> None:
+    """Fallback for layouts the regex does not cover (e.g. arrays before `version`)."""
     content = pyproject_path.read_text(encoding="utf-8")
 
     # More reliable: find [project] section and replace version within it
@@ -60,9 +100,9 @@ def update_version(new_version: str) -> None:
             continue
 
         # If we're in [project] section, look for version line
-        if in_project_section and re.match(r'^\s*version\s*=\s*"', line):
+        if in_project_section and _VERSION_LINE_RE.match(line):
             # Replace the version value
-            lines[i] = re.sub(r'(version\s*=\s*")[^"]+(")', rf"\g<1>{new_version}\g<2>", line)
+            lines[i] = _VERSION_VALUE_RE.sub(rf"\g<1>{new_version}\g<2>", line)
             updated = True
             break
 
@@ -72,7 +112,6 @@ def update_version(new_version: str) -> None:
 
     new_content = "\n".join(lines)
     pyproject_path.write_text(new_content, encoding="utf-8")
-    print(f"✓ Updated version in pyproject.toml to {new_version}")
 
 
 def get_last_tag() -> str | None:
@@ -83,18 +122,18 @@ def get_last_tag() -> str | None:
         result = subprocess.run(
             ["git", "tag", "--list", "v[0-9]*.[0-9]*.[0-9]*"],
             capture_output=True,
-            text=True,
             check=True,
         )
     except subprocess.CalledProcessError:
         return None
 
-    tags = [t.strip() for t in result.stdout.split("\n") if t.strip()]
+    # Work on raw bytes and decode only the surviving lines.
+    tags = [t.decode("utf-8") for t in (raw.strip() for raw in result.stdout.splitlines()) if t]
     if not tags:
         return None
 
     def parse_tag(tag: str) -> tuple[int, int, int]:
-        m = re.match(r"^v(\d+)\.(\d+)\.(\d+)$", tag)
+        m = _SEMVER_TAG_RE.match(tag)
         if not m:
             # Put non-matching tags at the bottom
             return (-1, -1, -1)
@@ -113,18 +152,42 @@ def get_commits_since_tag(tag: str | None) -> list[str]:
     else:
         range_spec = "HEAD"
 
-    try:
-        result = subprocess.run(
-            ["git", "log", "--pretty=format:%s", range_spec],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        commits = [line.strip() for line in result.stdout.strip().split("\n") if line.strip()]
-        return commits
-    except subprocess.CalledProcessError as e:
-        print(f"Error getting commits: {e}")
-        sys.exit(1)
+    # Stream NUL-separated subjects instead of buffering the whole log. stderr
+    # goes to a temp file so it is kept for the error report without risking a
+    # full pipe blocking git while stdout is still being read.
+    args = ["git", "log", "-z", "--pretty=format:%s", range_spec]
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(args, stdout=subprocess.PIPE, stderr=stderr_file) as proc:
+            commits = [
+                subject
+                for subject in (
+                    raw.decode("utf-8", errors="replace").strip()
+                    for raw in _iter_nul_separated(proc.stdout)
+                )
+                if subject
+            ]
+        if proc.returncode != 0:
+            stderr_file.seek(0)
+            error = subprocess.CalledProcessError(
+                proc.returncode,
+                args,
+                stderr=stderr_file.read().decode("utf-8", errors="replace"),
+            )
+            print(f"Error getting commits: {error}")
+            if error.stderr.strip():
+                print(error.stderr.strip())
+            sys.exit(1)
+    return commits
+
+
+def _iter_nul_separated(stream: IO[bytes]) -> Iterator[bytes]:
+    """Yield NUL-separated records from a binary stream as they arrive."""
+    pending = b""
+    for chunk in iter(lambda: stream.read(65536), b""):
+        *records, pending = (pending + chunk).split(b"\x00")
+        yield from records
+    if pending:
+        yield pending
 
 
 def create_changelog(old_version: str, new_version: str, commits: list[str]) -> str:
@@ -146,7 +209,6 @@ def check_git_status() -> None:
     result = subprocess.run(
         ["git", "status", "--porcelain"],
         capture_output=True,
-        text=True,
         check=True,
     )
     if result.stdout.strip():
@@ -157,20 +219,19 @@ def check_git_status() -> None:
             sys.exit(1)
 
 
-def create_tag_and_commit(new_version: str, changelog: str) -> None:
-    """Create a commit with changelog and tag it."""
-    tag_name = f"v{new_version}"
-
-    # Check if tag already exists
+def tag_exists(tag_name: str) -> bool:
+    """Check whether a tag with the given name already exists."""
     result = subprocess.run(
         ["git", "tag", "-l", tag_name],
         capture_output=True,
-        text=True,
         check=True,
     )
-    if result.stdout.strip():
-        print(f"Error: Tag {tag_name} already exists")
-        sys.exit(1)
+    return bool(result.stdout.strip())
+
+
+def create_tag_and_commit(new_version: str, changelog: str) -> None:
+    """Create a commit with changelog and tag it."""
+    tag_name = f"v{new_version}"
 
     # Stage pyproject.toml
     subprocess.run(["git", "add", "pyproject.toml"], check=True)
@@ -213,15 +274,20 @@ def push_to_remote() -> None:
 
 def main() -> None:
     """Main function."""
-    # Check git status
-    check_git_status()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Tag discovery is independent of the working tree check, so run it
+        # while `git status` (and any prompt it raises) is in progress.
+        last_tag_future = executor.submit(get_last_tag)
+
+        # Check git status
+        check_git_status()
 
-    # Get current version
-    current_version = get_current_version()
-    print(f"Current version: {current_version}")
+        # Get current version
+        current_version = get_current_version()
+        print(f"Current version: {current_version}")
 
-    # Get last tag
-    last_tag = get_last_tag()
+        # Get last tag
+        last_tag = last_tag_future.result()
     if last_tag:
         print(f"Last tag: {last_tag}")
     else:
@@ -232,7 +298,7 @@ def main() -> None:
     print(f"\nFound {len(commits)} commit(s) since last tag:")
 
     if commits:
-        for i, commit in enumerate(commits[:10], 1):  # Show first 10
+        for i, commit in enumerate(islice(commits, 10), 1):  # Show first 10
             print(f"  {i}. {commit}")
         if len(commits) > 10:
             print(f"  ... and {len(commits) - 10} more")
@@ -247,33 +313,43 @@ def main() -> None:
         print("Error: Version cannot be empty")
         sys.exit(1)
 
-    # Validate version format (basic check)
-    if not re.match(r"^\d+\.\d+\.\d+", new_version):
-        response = input(
-            f"Warning: '{new_version}' doesn't match standard version format (X.Y.Z). "
-            "Continue? (y/N): "
-        )
+    tag_name = f"v{new_version}"
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Look up the tag while the user reads the preview and answers prompts.
+        tag_exists_future = executor.submit(tag_exists, tag_name)
+
+        # Validate version format (basic check)
+        if not _VERSION_FORMAT_RE.match(new_version):
+            response = input(
+                f"Warning: '{new_version}' doesn't match standard version format (X.Y.Z). "
+                "Continue? (y/N): "
+            )
+            if response.lower() != "y":
+                print("Aborted.")
+                sys.exit(1)
+
+        # Create changelog
+        old_version = last_tag.lstrip("v") if last_tag else current_version
+        changelog = create_changelog(old_version, new_version, commits)
+
+        # Show preview
+        print("\n" + "=" * 60)
+        print("Changelog preview:")
+        print("=" * 60)
+        print(changelog)
+        print("=" * 60)
+        print()
+
+        # Confirm
+        response = input("Proceed with version bump? (y/N): ")
         if response.lower() != "y":
             print("Aborted.")
             sys.exit(1)
 
-    # Create changelog
-    old_version = last_tag.lstrip("v") if last_tag else current_version
-    changelog = create_changelog(old_version, new_version, commits)
-
-    # Show preview
-    print("\n" + "=" * 60)
-    print("Changelog preview:")
-    print("=" * 60)
-    print(changelog)
-    print("=" * 60)
-    print()
-
-    # Confirm
-    response = input("Proceed with version bump? (y/N): ")
-    if response.lower() != "y":
-        print("Aborted.")
-        sys.exit(1)
+        # Check if tag already exists (before touching pyproject.toml)
+        if tag_exists_future.result():
+            print(f"Error: Tag {tag_name} already exists")
+            sys.exit(1)
 
     # Update version
     update_version(new_version)
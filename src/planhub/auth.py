@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import subprocess
+from functools import lru_cache
 
 
 def get_auth_token() -> str | None:
@@ -11,13 +12,19 @@ def get_auth_token() -> str | None:
     return _get_token_from_gh()
 
 
+# `gh auth token` costs a process spawn; its answer does not change within a run.
+@lru_cache(maxsize=1)
 def _get_token_from_gh() -> str | None:
-    result = subprocess.run(
-        ["gh", "auth", "token"],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except FileNotFoundError:
+        # GitHub CLI is not installed.
+        return None
     if result.returncode != 0:
         return None
     token = result.stdout.strip()
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import typer
 
-from planhub.cli.commands import init_command, issue_command, setup_command, sync_command
-
 app = typer.Typer(help="Planhub CLI.")
 
 
@@ -13,6 +11,8 @@ def init_entry(
         False, "--dry-run", help="Show what would change without writing."
     ),
 ) -> None:
+    from planhub.cli.commands.init import init_command
+
     init_command(dry_run=dry_run)
 
 
@@ -22,6 +22,8 @@ def setup_entry(
         False, "--dry-run", help="Show what would change without writing."
     ),
 ) -> None:
+    from planhub.cli.commands.setup import setup_command
+
     setup_command(dry_run=dry_run)
 
 
@@ -33,6 +35,8 @@ def sync_entry(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed sync output."),
     compact: bool = typer.Option(False, "--compact", help="Force compact sync output."),
 ) -> None:
+    from planhub.cli.commands.sync import sync_command
+
     verbosity_override: str | None = None
     if verbose and compact:
         raise typer.BadParameter("Use either --verbose or --compact, not both.")
@@ -45,6 +49,8 @@ def sync_entry(
 
 @app.command("issue")
 def issue_entry(title: str = typer.Argument(..., help="Title of the issue to create.")) -> None:
+    from planhub.cli.commands.issue import issue_command
+
     issue_command(title=title)
 
 
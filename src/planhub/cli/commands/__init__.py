@@ -1,6 +1,28 @@
-from planhub.cli.commands.init import init_command
-from planhub.cli.commands.issue import issue_command
-from planhub.cli.commands.setup import setup_command
-from planhub.cli.commands.sync import sync_command
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from planhub.cli.commands.init import init_command
+    from planhub.cli.commands.issue import issue_command
+    from planhub.cli.commands.setup import setup_command
+    from planhub.cli.commands.sync import sync_command
 
 __all__ = ["init_command", "issue_command", "sync_command", "setup_command"]
+
+_COMMAND_MODULES = {
+    "init_command": "planhub.cli.commands.init",
+    "issue_command": "planhub.cli.commands.issue",
+    "setup_command": "planhub.cli.commands.setup",
+    "sync_command": "planhub.cli.commands.sync",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve commands on first access so running one command does not import
+    # the others (and their GitHub/sync dependencies).
+    module_name = _COMMAND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name), name)
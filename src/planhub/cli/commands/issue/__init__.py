@@ -1,17 +1,15 @@
 from __future__ import annotations
 
-import re
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Any
 
 import typer
 
 from planhub.auth import get_auth_token
-from planhub.documents import render_markdown
-from planhub.github import GitHubClient
 from planhub.layout import ensure_layout
 from planhub.repository import get_github_repo_from_git
+from planhub.slug import slugify
 
 
 def issue_command(title: str) -> None:
@@ -31,6 +29,11 @@ def issue_command(title: str) -> None:
         typer.echo(f"Error: {exc}")
         raise typer.Exit(code=1) from exc
 
+    # Deferred until the checks above pass so their error paths skip the
+    # client and YAML imports.
+    from planhub.documents import render_markdown
+    from planhub.github import GitHubClient
+
     # Ensure .plan directory exists
     layout = ensure_layout(repo_root)
 
@@ -49,8 +52,8 @@ def issue_command(title: str) -> None:
         ]
 
         # Generate filename: YYYYMMDD-title-slug.md
-        date_str = datetime.now().strftime("%Y%m%d")
-        title_slug = _slugify(title) or "issue"
+        date_str = time.strftime("%Y%m%d")
+        title_slug = slugify(title, fallback="issue")
         base_name = f"{date_str}-{title_slug}"
         issue_path = layout.issues_dir / f"{base_name}.md"
 
@@ -74,16 +77,3 @@ def issue_command(title: str) -> None:
     except Exception as exc:
         typer.echo(f"Error creating issue: {exc}")
         raise typer.Exit(code=1) from exc
-
-
-def _slugify(value: str) -> str:
-    """Convert a string to a URL-friendly slug."""
-    slug: list[str] = []
-    for char in value.lower():
-        if char.isalnum():
-            slug.append(char)
-        elif char in {" ", "-", "_"}:
-            slug.append("-")
-    normalized = "".join(slug).strip("-")
-    normalized = re.sub(r"-+", "-", normalized)
-    return normalized or "issue"
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
 
-from planhub.auth import get_auth_token
 from planhub.cli.sync_plan import (
     apply_sync_plan,
     archive_closed_issues_in_filesystem,
@@ -14,10 +15,11 @@ from planhub.cli.sync_plan import (
 )
 from planhub.config import load_config
 from planhub.documents import DocumentError  # noqa: F401
-from planhub.github import GitHubClient
-from planhub.importer import ImportResult, import_existing_issues
 from planhub.layout import PlanLayout, load_layout
-from planhub.repository import get_github_repo_from_git
+
+if TYPE_CHECKING:
+    from planhub.github import GitHubClient
+    from planhub.importer import ImportResult
 
 
 @dataclass(frozen=True)
@@ -60,6 +62,7 @@ def sync_command(*, dry_run: bool, verbosity_override: str | None = None) -> Non
         raise typer.Exit(code=1)
 
     client: GitHubClient | None = None
+    remote_issues: list[Mapping[str, Any]] | None = None
     owner_repo, import_stats = _import_existing_issues_if_possible(
         layout,
         repo_root,
@@ -72,7 +75,7 @@ def sync_command(*, dry_run: bool, verbosity_override: str | None = None) -> Non
         imported_milestones_created=import_stats.milestones_created,
     )
     if owner_repo is not None:
-        client, owner_repo = owner_repo
+        client, owner_repo, remote_issues = owner_repo
 
     plan, parsed_milestones, parsed_issues, errors = build_sync_plan(layout)
     if _report_parse_errors(errors):
@@ -95,19 +98,17 @@ def sync_command(*, dry_run: bool, verbosity_override: str | None = None) -> Non
             _echo_verbose_plan(plan)
         return
 
-    if (
-        plan.milestones_to_create
-        or plan.issues_to_create
-        or plan.milestones_to_update
-        or plan.issues_to_update
-    ):
+    if not plan.is_empty:
+        # Only resolve credentials when there is work; an empty plan needs no client.
         if client is None:
             auth = _get_github_client(repo_root)
             if auth is None:
                 raise typer.Exit(code=1)
             client, owner, repo = auth
             owner_repo = (owner, repo)
-        apply_stats = apply_sync_plan(client, owner_repo, plan, errors, config, layout)
+        apply_stats = apply_sync_plan(
+            client, owner_repo, plan, errors, config, layout, remote_issues=remote_issues
+        )
         stats = SyncOutputStats(
             imported_created=stats.imported_created,
             imported_moved=stats.imported_moved,
@@ -159,7 +160,7 @@ def sync_command(*, dry_run: bool, verbosity_override: str | None = None) -> Non
         )
 
     if errors:
-        for error in errors:
+        for error in dict.fromkeys(errors):
             typer.echo(f"❌ {error}")
         raise typer.Exit(code=1)
     typer.echo("✅ Sync completed.")
@@ -173,7 +174,12 @@ def _import_existing_issues_if_possible(
     repo_root: Path,
     *,
     dry_run: bool,
-) -> tuple[tuple[GitHubClient, tuple[str, str]] | None, ImportResult]:
+) -> tuple[
+    tuple[GitHubClient, tuple[str, str], list[Mapping[str, Any]]] | None,
+    ImportResult,
+]:
+    from planhub.importer import ImportResult, import_existing_issues
+
     empty_result = ImportResult(
         issues_created=0,
         issues_moved=0,
@@ -184,20 +190,24 @@ def _import_existing_issues_if_possible(
     if auth is None:
         return None, empty_result
     client, owner, repo = auth
+    # One listing serves both the import and the update step's change detection.
+    remote_issues = client.list_issues(owner, repo, state="all")
     result = import_existing_issues(
         layout,
         owner,
         repo,
         client=client,
         dry_run=dry_run,
+        issues=remote_issues,
     )
-    return (client, (owner, repo)), result
+    return (client, (owner, repo), remote_issues), result
 
 
 def _report_parse_errors(errors: list[str]) -> bool:
     if not errors:
         return False
-    for error in errors:
+    # Many files can report the same problem; print each message once, in order.
+    for error in dict.fromkeys(errors):
         typer.echo(f"Error: {error}")
     return True
 
@@ -205,6 +215,11 @@ def _report_parse_errors(errors: list[str]) -> bool:
 def _get_github_client(
     repo_root: Path,
 ) -> tuple[GitHubClient, str, str] | None:
+    # Credential and client imports are only paid for when GitHub is contacted.
+    from planhub.auth import get_auth_token
+    from planhub.github import GitHubClient, default_response_cache
+    from planhub.repository import get_github_repo_from_git
+
     token = get_auth_token()
     if not token:
         typer.echo(
@@ -216,7 +231,7 @@ def _get_github_client(
     except ValueError as exc:
         typer.echo(f"⚠️ {exc} Cannot sync issues.")
         return None
-    return GitHubClient(token), owner, repo
+    return GitHubClient(token, cache=default_response_cache()), owner, repo
 
 
 def _echo_sync_summary(
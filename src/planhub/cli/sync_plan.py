@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import shutil
-from collections.abc import Callable, Mapping
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from threading import Lock
@@ -24,6 +23,7 @@ from planhub.layout import PlanLayout, discover_milestones, discover_root_issues
 from planhub.slug import slugify
 
 MAX_WORKERS = 5  # Conservative limit to avoid GitHub rate limits
+_REQUESTS_PER_WORKER = 100  # Rate budget each worker needs before another is added
 
 
 class SyncPlan:
@@ -34,6 +34,28 @@ class SyncPlan:
         self.issues_to_update: list[tuple[Path, IssueDocument, str | None]] = []
         self.milestone_numbers: dict[str, int] = {}
         self.milestone_titles_by_dir: dict[Path, str] = {}
+        self._milestone_numbers_casefold: dict[str, int] = {}
+
+    def set_milestone_number(self, title: str, number: int) -> None:
+        self.milestone_numbers[title] = number
+        self._milestone_numbers_casefold[title.casefold()] = number
+
+    def find_milestone_number(self, title: str) -> int | None:
+        """Look up a milestone number, falling back to a case-insensitive match."""
+        number = self.milestone_numbers.get(title)
+        if number is None:
+            number = self._milestone_numbers_casefold.get(title.casefold())
+        return number
+
+    @property
+    def is_empty(self) -> bool:
+        """True when there is nothing to send to GitHub."""
+        return not (
+            self.milestones_to_create
+            or self.milestones_to_update
+            or self.issues_to_create
+            or self.issues_to_update
+        )
 
 
 @dataclass(frozen=True)
@@ -146,7 +168,7 @@ def build_sync_plan(
     parsed_milestones = 0
     parsed_issues = 0
     for entry in discover_milestones(layout):
-        if not entry.milestone_file.exists():
+        if not entry.has_milestone_file:
             errors.append(f"{entry.milestone_file}: missing milestone.md")
             continue
         try:
@@ -154,9 +176,10 @@ def build_sync_plan(
         except DocumentError as exc:
             errors.append(str(exc))
             continue
-        plan.milestone_titles_by_dir[entry.directory] = milestone_doc.title
+        milestone_title = milestone_doc.title
+        plan.milestone_titles_by_dir[entry.directory] = milestone_title
         if milestone_doc.number is not None:
-            plan.milestone_numbers[milestone_doc.title] = milestone_doc.number
+            plan.set_milestone_number(milestone_title, milestone_doc.number)
             plan.milestones_to_update.append((entry.milestone_file, milestone_doc))
         else:
             plan.milestones_to_create.append((entry.milestone_file, milestone_doc))
@@ -174,15 +197,29 @@ def apply_sync_plan(
     errors: list[str],
     config: PlanHubConfig,
     layout: PlanLayout,
+    *,
+    remote_issues: Sequence[Mapping[str, object]] | None = None,
 ) -> SyncExecutionStats:
+    """Push the plan to GitHub.
+
+    `remote_issues` is an optional `list_issues(state="all")` snapshot the caller
+    already fetched; issues that match it skip their PATCH.
+    """
     if owner_repo is None:
         errors.append("Missing repository information for sync.")
         return SyncExecutionStats()
+    if plan.is_empty:
+        return SyncExecutionStats()
     owner, repo = owner_repo
     milestones_created = _create_missing_milestones(client, owner, repo, plan, errors)
-    milestones_updated = _update_existing_milestones(client, owner, repo, plan, errors)
+    updated_milestones: dict[int, Mapping[str, object]] = {}
+    milestones_updated = _update_existing_milestones(
+        client, owner, repo, plan, errors, updated_milestones
+    )
     issues_created = _create_missing_issues(client, owner, repo, plan, errors, config)
-    issues_updated = _update_existing_issues(client, layout, owner, repo, plan, errors, config)
+    issues_updated = _update_existing_issues(
+        client, layout, owner, repo, plan, errors, config, remote_issues, updated_milestones
+    )
     return SyncExecutionStats(
         issues_created=issues_created,
         issues_updated=issues_updated,
@@ -193,6 +230,7 @@ def apply_sync_plan(
 
 def _collect_issues_for_entry(entry, plan: SyncPlan, errors: list[str]) -> int:
     parsed = 0
+    milestone_title = plan.milestone_titles_by_dir.get(entry.directory)
     for issue_file in entry.issue_files:
         try:
             issue_doc = load_issue_document(issue_file)
@@ -202,21 +240,9 @@ def _collect_issues_for_entry(entry, plan: SyncPlan, errors: list[str]) -> int:
         if _validate_issue_state(issue_doc, issue_file, errors):
             continue
         if issue_doc.number is None:
-            plan.issues_to_create.append(
-                (
-                    issue_file,
-                    issue_doc,
-                    plan.milestone_titles_by_dir.get(entry.directory),
-                )
-            )
+            plan.issues_to_create.append((issue_file, issue_doc, milestone_title))
         else:
-            plan.issues_to_update.append(
-                (
-                    issue_file,
-                    issue_doc,
-                    plan.milestone_titles_by_dir.get(entry.directory),
-                )
-            )
+            plan.issues_to_update.append((issue_file, issue_doc, milestone_title))
         parsed += 1
     return parsed
 
@@ -253,8 +279,13 @@ def _create_missing_milestones(
     plan: SyncPlan,
     errors: list[str],
 ) -> int:
+    errors_lock = Lock()
     modified_count = 0
-    for milestone_path, milestone_doc in plan.milestones_to_create:
+    modified_count_lock = Lock()
+    milestone_numbers_lock = Lock()
+
+    def create_single_milestone(milestone_path: Path, milestone_doc: MilestoneDocument) -> None:
+        nonlocal modified_count
         created = client.create_milestone(
             owner,
             repo,
@@ -264,18 +295,33 @@ def _create_missing_milestones(
             state=milestone_doc.state.value if milestone_doc.state else None,
         )
         number = created.get("number")
-        if isinstance(number, int):
-            cached_metadata = milestone_document_to_metadata(milestone_doc)
-            if update_front_matter(
-                milestone_path,
-                {"number": number},
-                cached_metadata=cached_metadata,
-                cached_body=milestone_doc.body,
-            ):
+        if not isinstance(number, int):
+            with errors_lock:
+                errors.append(f"{milestone_path}: GitHub did not return a number.")
+            return
+        cached_metadata = milestone_doc.front_matter or milestone_document_to_metadata(
+            milestone_doc
+        )
+        if update_front_matter(
+            milestone_path,
+            {"number": number},
+            cached_metadata=cached_metadata,
+            cached_body=milestone_doc.body,
+        ):
+            with modified_count_lock:
                 modified_count += 1
-            plan.milestone_numbers[milestone_doc.title] = number
-        else:
-            errors.append(f"{milestone_path}: GitHub did not return a number.")
+        with milestone_numbers_lock:
+            plan.set_milestone_number(milestone_doc.title, number)
+
+    # All milestones are created before any issue is scheduled, so issues can
+    # resolve milestone numbers from `plan.milestone_numbers`.
+    _run_parallel(
+        plan.milestones_to_create,
+        lambda item: create_single_milestone(item[0], item[1]),
+        errors,
+        errors_lock,
+        max_workers=_worker_count(client),
+    )
     return modified_count
 
 
@@ -285,7 +331,13 @@ def _update_existing_milestones(
     repo: str,
     plan: SyncPlan,
     errors: list[str],
+    updated_milestones: dict[int, Mapping[str, object]],
 ) -> int:
+    """PATCH existing milestones, recording GitHub's response by number.
+
+    The issue update step uses `updated_milestones` to refresh the milestone
+    embedded in a `list_issues` snapshot taken before these updates.
+    """
     errors_lock = Lock()
 
     def update_single_milestone(milestone_path: Path, milestone_doc: MilestoneDocument) -> None:
@@ -293,7 +345,7 @@ def _update_existing_milestones(
             with errors_lock:
                 errors.append(f"{milestone_path}: missing milestone number.")
             return
-        client.update_milestone(
+        updated = client.update_milestone(
             owner,
             repo,
             milestone_doc.number,
@@ -302,12 +354,16 @@ def _update_existing_milestones(
             due_on=milestone_doc.due_on,
             state=milestone_doc.state.value if milestone_doc.state else None,
         )
+        if isinstance(updated, Mapping):
+            with errors_lock:
+                updated_milestones[milestone_doc.number] = updated
 
     _run_parallel(
         plan.milestones_to_update,
         lambda item: update_single_milestone(item[0], item[1]),
         errors,
         errors_lock,
+        max_workers=_worker_count(client),
     )
     # Existing milestone sync currently updates GitHub only and does not mutate
     # local milestone files.
@@ -328,7 +384,7 @@ def _resolve_milestone_number(
     milestone_number = None
     effective_title = issue_doc.milestone or milestone_title
     if effective_title:
-        milestone_number = plan.milestone_numbers.get(effective_title)
+        milestone_number = plan.find_milestone_number(effective_title)
         if milestone_number is None:
             errors.append(f"{issue_path}: milestone '{effective_title}' has no number.")
     return milestone_number, False
@@ -362,15 +418,10 @@ def _create_missing_issues(
             milestone_number = None
         if (issue_doc.milestone or milestone_title) and milestone_number is None:
             return
-        labels = (
-            list(issue_doc.labels)
-            if issue_doc.labels_set
-            else list(config.sync.github.default_labels)
-        )
+        # Tuples are passed through as-is; the JSON encoder serializes them as arrays.
+        labels = issue_doc.labels if issue_doc.labels_set else config.sync.github.default_labels
         assignees = (
-            list(issue_doc.assignees)
-            if issue_doc.assignees_set
-            else list(config.sync.github.default_assignees)
+            issue_doc.assignees if issue_doc.assignees_set else config.sync.github.default_assignees
         )
         created = client.create_issue(
             owner,
@@ -384,7 +435,7 @@ def _create_missing_issues(
         )
         issue_number = created.get("number")
         if isinstance(issue_number, int):
-            cached_metadata = issue_document_to_metadata(issue_doc)
+            cached_metadata = issue_doc.front_matter or issue_document_to_metadata(issue_doc)
             state_updates = _state_updates_from_github_issue(created)
             changed = update_front_matter(
                 issue_path,
@@ -405,6 +456,7 @@ def _create_missing_issues(
         lambda item: create_single_issue(item[0], item[1], item[2]),
         errors,
         errors_lock,
+        max_workers=_worker_count(client),
     )
     return modified_count
 
@@ -417,6 +469,8 @@ def _update_existing_issues(
     plan: SyncPlan,
     errors: list[str],
     config: PlanHubConfig,
+    remote_issues_snapshot: Sequence[Mapping[str, object]] | None,
+    updated_milestones: Mapping[int, Mapping[str, object]],
 ) -> int:
     errors_lock = Lock()
     milestone_creation_lock = Lock()
@@ -424,6 +478,7 @@ def _update_existing_issues(
     move_locks_registry_lock = Lock()
     modified_count = 0
     modified_count_lock = Lock()
+    remote_issues = _remote_issues_by_number(remote_issues_snapshot)
 
     def _move_lock_for_dir(target_dir: Path) -> Lock:
         with move_locks_registry_lock:
@@ -442,30 +497,31 @@ def _update_existing_issues(
             with errors_lock:
                 errors.append(f"{issue_path}: missing issue number.")
             return
-        labels = (
-            list(issue_doc.labels)
-            if issue_doc.labels_set
-            else list(config.sync.github.default_labels)
-        )
+        labels = issue_doc.labels if issue_doc.labels_set else config.sync.github.default_labels
         assignees = (
-            list(issue_doc.assignees)
-            if issue_doc.assignees_set
-            else list(config.sync.github.default_assignees)
+            issue_doc.assignees if issue_doc.assignees_set else config.sync.github.default_assignees
         )
         local_modified = False
-        updated_issue = client.update_issue(
-            owner,
-            repo,
-            issue_doc.number,
-            title=issue_doc.title,
-            body=issue_doc.body or None,
-            labels=labels,
-            assignees=assignees,
-            issue_type=issue_doc.issue_type,
-            # Keep issue state authoritative on GitHub during sync.
-            state=None,
-            state_reason=None,
-        )
+        remote_issue = remote_issues.get(issue_doc.number)
+        if remote_issue is not None and _issue_matches_remote(
+            issue_doc, labels, assignees, remote_issue
+        ):
+            # Nothing to send; reconcile state and milestone from the snapshot.
+            updated_issue = _with_updated_milestone(remote_issue, updated_milestones)
+        else:
+            updated_issue = client.update_issue(
+                owner,
+                repo,
+                issue_doc.number,
+                title=issue_doc.title,
+                body=issue_doc.body or None,
+                labels=labels,
+                assignees=assignees,
+                issue_type=issue_doc.issue_type,
+                # Keep issue state authoritative on GitHub during sync.
+                state=None,
+                state_reason=None,
+            )
         state_updates = _state_updates_from_github_issue(updated_issue)
 
         (
@@ -519,6 +575,8 @@ def _update_existing_issues(
             changed = update_front_matter(
                 issue_path,
                 updates,
+                cached_metadata=issue_doc.front_matter or None,
+                cached_body=issue_doc.body,
             )
             local_modified = local_modified or changed
 
@@ -531,28 +589,113 @@ def _update_existing_issues(
         lambda item: update_single_issue(item[0], item[1], item[2]),
         errors,
         errors_lock,
+        max_workers=_worker_count(client),
     )
     return modified_count
 
 
+def _remote_issues_by_number(
+    issues: Sequence[Mapping[str, object]] | None,
+) -> dict[int, Mapping[str, object]]:
+    """Index a GitHub issue snapshot so unchanged issues can skip their PATCH."""
+    if issues is None:
+        # Only an optimization: without a snapshot every issue is updated.
+        return {}
+    return {
+        issue["number"]: issue
+        for issue in issues
+        if isinstance(issue, Mapping)
+        and isinstance(issue.get("number"), int)
+        and not issue.get("pull_request")
+    }
+
+
+def _with_updated_milestone(
+    remote_issue: Mapping[str, object],
+    updated_milestones: Mapping[int, Mapping[str, object]],
+) -> Mapping[str, object]:
+    """Swap in a milestone PATCHed after the snapshot, e.g. a local rename."""
+    milestone = remote_issue.get("milestone")
+    if not isinstance(milestone, Mapping) or not isinstance(milestone.get("number"), int):
+        return remote_issue
+    updated = updated_milestones.get(milestone["number"])
+    if updated is None:
+        return remote_issue
+    return {**remote_issue, "milestone": updated}
+
+
+def _issue_matches_remote(
+    issue_doc: IssueDocument,
+    labels: Sequence[str],
+    assignees: Sequence[str],
+    remote_issue: Mapping[str, object],
+) -> bool:
+    """True when an update_issue call would not change any field on GitHub."""
+    if remote_issue.get("title") != issue_doc.title:
+        return False
+    # An empty local body is not sent, so it never differs.
+    if issue_doc.body and remote_issue.get("body") != issue_doc.body:
+        return False
+    if sorted(labels) != sorted(_names(remote_issue.get("labels"), "name")):
+        return False
+    if sorted(assignees) != sorted(_names(remote_issue.get("assignees"), "login")):
+        return False
+    if issue_doc.issue_type is not None:
+        remote_type = remote_issue.get("type")
+        if not isinstance(remote_type, Mapping) or remote_type.get("name") != issue_doc.issue_type:
+            return False
+    return True
+
+
+def _names(items: object, key: str) -> list[str]:
+    if not isinstance(items, list):
+        return []
+    names = (item.get(key) for item in items if isinstance(item, Mapping))
+    return [name for name in names if isinstance(name, str)]
+
+
+def _worker_count(client: GitHubClient) -> int:
+    """Shrink the pool as the rate-limit budget runs low.
+
+    Before the first response the budget is unknown, so the full pool is used.
+    """
+    remaining = client.rate_limit_remaining
+    if not isinstance(remaining, int):
+        return MAX_WORKERS
+    return max(1, min(MAX_WORKERS, remaining // _REQUESTS_PER_WORKER))
+
+
 def _run_parallel(
     items: list,
     func: Callable,
     errors: list[str],
     errors_lock: Lock,
+    *,
+    max_workers: int = MAX_WORKERS,
 ) -> None:
     """Run a function in parallel over a list of items."""
     if not items:
         return
 
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(func, item): item for item in items}
-        for future in as_completed(futures):
-            try:
-                future.result()
-            except Exception as exc:
-                with errors_lock:
-                    errors.append(f"Parallel execution error: {exc}")
+    # Imported here: plan building and dry runs never reach this point.
+    from concurrent.futures import ThreadPoolExecutor
+
+    def run_item(item) -> None:
+        try:
+            func(item)
+        except Exception as exc:
+            with errors_lock:
+                errors.append(f"Parallel execution error: {exc}")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Failures are recorded by run_item, so the results only need draining.
+        for _ in executor.map(run_item, items):
+            pass
+
+
+# Built once; _state_updates_from_github_issue runs for every created/updated issue.
+_VALID_STATES = frozenset(state.value for state in IssueState)
+_VALID_STATE_REASONS = frozenset(reason.value for reason in IssueStateReason)
 
 
 def _state_updates_from_github_issue(
@@ -561,13 +704,12 @@ def _state_updates_from_github_issue(
     if not isinstance(issue_payload, Mapping):
         return {}
     raw_state = issue_payload.get("state")
-    if raw_state not in (IssueState.OPEN.value, IssueState.CLOSED.value):
+    if raw_state not in _VALID_STATES:
         return {}
     updates: dict[str, str | None] = {"state": raw_state}
     raw_reason = issue_payload.get("state_reason")
     if raw_state == IssueState.CLOSED.value and isinstance(raw_reason, str):
-        valid_reasons = {reason.value for reason in IssueStateReason}
-        updates["state_reason"] = raw_reason if raw_reason in valid_reasons else None
+        updates["state_reason"] = raw_reason if raw_reason in _VALID_STATE_REASONS else None
         return updates
     updates["state_reason"] = None
     return updates
@@ -590,13 +732,9 @@ def archive_closed_issues_in_filesystem(
     policy = config.sync.closed_issues.policy
     archive_dir = config.sync.closed_issues.archive_dir
 
-    def iter_issue_files() -> list[Path]:
-        return list(discover_root_issues(layout))
-
-    issue_files = iter_issue_files()
     archived_count = 0
     deleted_count = 0
-    for issue_path in issue_files:
+    for issue_path in discover_root_issues(layout):
         try:
             issue_doc = load_issue_document(issue_path)
         except DocumentError as exc:
@@ -680,11 +818,10 @@ def reconcile_milestone_archive_locations(
 
     if move_open_to_active:
         for archived_dir in _iter_milestone_dirs(milestone_archive_root):
-            milestone_path = archived_dir / "milestone.md"
-            if not milestone_path.exists():
-                continue
             try:
-                milestone_doc = load_milestone_document(milestone_path)
+                milestone_doc = load_milestone_document(archived_dir / "milestone.md")
+            except FileNotFoundError:
+                continue
             except DocumentError as exc:
                 errors.append(str(exc))
                 continue
@@ -693,6 +830,8 @@ def reconcile_milestone_archive_locations(
 
     if move_closed_to_archive:
         for entry in discover_milestones(layout):
+            if not entry.has_milestone_file:
+                continue
             try:
                 milestone_doc = load_milestone_document(entry.milestone_file)
             except DocumentError as exc:
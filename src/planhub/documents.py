@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+import itertools
+import re
+import sys
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from planhub.github import IssueState, IssueStateReason
+from planhub.github import (
+    ISSUE_STATE_REASONS_BY_VALUE,
+    ISSUE_STATES_BY_VALUE,
+    IssueState,
+    IssueStateReason,
+)
+
+# libyaml's C loader/dumper are much faster; PyYAML builds without it fall back.
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
 
 
 class DocumentError(ValueError):
@@ -33,6 +48,9 @@ class IssueDocument:
     issue_type: str | None
     state: IssueState | None
     state_reason: IssueStateReason | None
+    # Front matter as parsed, so write-backs can skip re-reading the file and
+    # keep keys planhub does not model. Empty for documents not read from disk.
+    front_matter: Mapping[str, Any] = field(default_factory=dict, repr=False, compare=False)
 
 
 @dataclass(frozen=True)
@@ -45,9 +63,37 @@ class MilestoneDocument:
     milestone_id: str | None
     number: int | None
     body: str
+    front_matter: Mapping[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+
+# Parsed documents are immutable, so results can be shared between sync phases.
+# Keying on inode, mtime and size picks up edits made between calls. A rewrite
+# that keeps the size within one mtime tick would still match, so our own
+# writes also bump a per-path generation.
+_DOCUMENT_CACHE_SIZE = 4096
+_write_counter = itertools.count(1)
+_write_generations: dict[Path, int] = {}
 
 
 def load_issue_document(path: Path) -> IssueDocument:
+    stat = path.stat()
+    return _load_issue_document_cached(
+        path, stat.st_ino, stat.st_mtime_ns, stat.st_size, _write_generations.get(path, 0)
+    )
+
+
+def load_milestone_document(path: Path) -> MilestoneDocument:
+    stat = path.stat()
+    return _load_milestone_document_cached(
+        path, stat.st_ino, stat.st_mtime_ns, stat.st_size, _write_generations.get(path, 0)
+    )
+
+
+@lru_cache(maxsize=_DOCUMENT_CACHE_SIZE)
+def _load_issue_document_cached(
+    path: Path, inode: int, mtime_ns: int, size: int, generation: int
+) -> IssueDocument:
+    del inode, mtime_ns, size, generation  # Cache key only.
     metadata, body = _parse_front_matter(path, path.read_text(encoding="utf-8"))
     title = _require_str(metadata, "title", path)
     issue_id = _optional_str(metadata, "id", path)
@@ -76,12 +122,19 @@ def load_issue_document(path: Path) -> IssueDocument:
         issue_type=issue_type,
         state=state,
         state_reason=state_reason,
+        front_matter=metadata,
     )
 
 
-def load_milestone_document(path: Path) -> MilestoneDocument:
+@lru_cache(maxsize=_DOCUMENT_CACHE_SIZE)
+def _load_milestone_document_cached(
+    path: Path, inode: int, mtime_ns: int, size: int, generation: int
+) -> MilestoneDocument:
+    del inode, mtime_ns, size, generation  # Cache key only.
     metadata, body = _parse_front_matter(path, path.read_text(encoding="utf-8"))
-    title = _require_str(metadata, "title", path)
+    # Milestone titles key SyncPlan lookups for every issue; interned strings
+    # let those dict hits short-circuit on identity.
+    title = sys.intern(_require_str(metadata, "title", path))
     milestone_id = _optional_str(metadata, "id", path)
     number = _optional_int(metadata, "number", path)
     description = _optional_str(metadata, "description", path) or body or None
@@ -96,6 +149,7 @@ def load_milestone_document(path: Path) -> MilestoneDocument:
         milestone_id=milestone_id,
         number=number,
         body=body,
+        front_matter=metadata,
     )
 
 
@@ -124,15 +178,15 @@ def update_front_matter(
     if merged == metadata:
         return False
     path.write_text(render_markdown(merged, body), encoding="utf-8")
+    _write_generations[path] = next(_write_counter)
     return True
 
 
 def render_markdown(front_matter: Mapping[str, Any], body: str) -> str:
-    yaml_text = yaml.safe_dump(front_matter, sort_keys=False).strip()
-    sections = ["---", yaml_text, "---", ""]
+    yaml_text = yaml.dump(front_matter, Dumper=_SafeDumper, sort_keys=False).strip()
     if body:
-        sections.append(body)
-    return "\n".join(sections) + "\n"
+        return f"---\n{yaml_text}\n---\n\n{body}\n"
+    return f"---\n{yaml_text}\n---\n\n"
 
 
 def issue_document_to_metadata(doc: IssueDocument) -> dict[str, Any]:
@@ -177,9 +231,51 @@ def milestone_document_to_metadata(doc: MilestoneDocument) -> dict[str, Any]:
 
 
 def _parse_front_matter(path: Path, text: str) -> tuple[Mapping[str, Any], str]:
+    yaml_text, body = _split_front_matter(path, text)
+    if yaml_text is None:
+        return {}, text
+    metadata = yaml.load(yaml_text, Loader=_SafeLoader) if yaml_text.strip() else {}
+    if metadata is None:
+        metadata = {}
+    if not isinstance(metadata, dict):
+        raise DocumentError(path, "Front matter must be a mapping.")
+    return metadata, body
+
+
+# Delimiter lines are `---` with optional surrounding whitespace (but not newlines).
+_OPENING_DELIMITER_RE = re.compile(r"[^\S\n]*---[^\S\n]*(?:\n|\Z)")
+_CLOSING_DELIMITER_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+# Line boundaries other than "\n" that str.splitlines() also honours.
+_OTHER_LINE_BREAKS_RE = re.compile("[\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def _split_front_matter(path: Path, text: str) -> tuple[str | None, str]:
+    """Return the raw YAML block (None without front matter) and the body."""
+    if _OTHER_LINE_BREAKS_RE.search(text):
+        return _split_front_matter_by_lines(path, text)
+    opening = _OPENING_DELIMITER_RE.match(text)
+    if opening is None:
+        return None, text
+    closing = _CLOSING_DELIMITER_RE.search(text, opening.end())
+    if closing is None:
+        raise DocumentError(path, "Missing closing front matter delimiter '---'.")
+    # Match the line-based split: no trailing newline on either part, and one
+    # blank line after the closing delimiter is dropped from the body.
+    body = text[closing.end() + 1 :]
+    if body.endswith("\n"):
+        body = body[:-1]
+    if body.startswith("\n"):
+        body = body[1:]
+    yaml_text = text[opening.end() : closing.start()]
+    if yaml_text.endswith("\n"):
+        yaml_text = yaml_text[:-1]
+    return yaml_text, body
+
+
+def _split_front_matter_by_lines(path: Path, text: str) -> tuple[str | None, str]:
     lines = text.splitlines()
     if not lines or lines[0].strip() != "---":
-        return {}, text
+        return None, text
     end_index = None
     for index in range(1, len(lines)):
         if lines[index].strip() == "---":
@@ -191,12 +287,7 @@ def _parse_front_matter(path: Path, text: str) -> tuple[Mapping[str, Any], str]:
     body = "\n".join(lines[end_index + 1 :])
     if body.startswith("\n"):
         body = body[1:]
-    metadata = yaml.safe_load(yaml_text) if yaml_text.strip() else {}
-    if metadata is None:
-        metadata = {}
-    if not isinstance(metadata, dict):
-        raise DocumentError(path, "Front matter must be a mapping.")
-    return metadata, body
+    return yaml_text, body
 
 
 def _require_str(metadata: Mapping[str, Any], key: str, path: Path) -> str:
@@ -246,7 +337,7 @@ def _optional_milestone(
     if isinstance(value, int):
         return None, value, True
     if isinstance(value, str):
-        return value, None, True
+        return sys.intern(value), None, True
     raise DocumentError(path, "Expected 'milestone' to be a string, int, or null.")
 
 
@@ -259,10 +350,10 @@ def _parse_issue_state(value: Any, path: Path) -> IssueState | None:
         return None
     if not isinstance(value, str):
         raise DocumentError(path, "Expected 'state' to be a string.")
-    try:
-        return IssueState(value)
-    except ValueError as exc:
-        raise DocumentError(path, f"Unknown state '{value}'.") from exc
+    state = ISSUE_STATES_BY_VALUE.get(value)
+    if state is None:
+        raise DocumentError(path, f"Unknown state '{value}'.")
+    return state
 
 
 def _parse_state_reason(value: Any, path: Path) -> IssueStateReason | None:
@@ -270,7 +361,7 @@ def _parse_state_reason(value: Any, path: Path) -> IssueStateReason | None:
         return None
     if not isinstance(value, str):
         raise DocumentError(path, "Expected 'state_reason' to be a string.")
-    try:
-        return IssueStateReason(value)
-    except ValueError as exc:
-        raise DocumentError(path, f"Unknown state_reason '{value}'.") from exc
+    reason = ISSUE_STATE_REASONS_BY_VALUE.get(value)
+    if reason is None:
+        raise DocumentError(path, f"Unknown state_reason '{value}'.")
+    return reason
@@ -1,14 +1,37 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
 import time
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from enum import Enum
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+if TYPE_CHECKING:
+    import requests
+
+# Rate-limited responses are retried after the wait GitHub asks for, this many times.
+_MAX_RATE_LIMIT_RETRIES = 3
+_MAX_RETRY_AFTER_SECONDS = 60
+# Response cache bounds: entries are revalidated anyway, so old ones only cost disk.
+_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_PAGE_FETCH_WORKERS = 5
+_LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# orjson is an optional speedup for decoding large paginated responses.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 @dataclass(frozen=True)
@@ -32,8 +55,127 @@ class IssueStateReason(Enum):
     REOPENED = "reopened"
 
 
+# Value -> member lookups for parsing; plain dict hits skip the Enum metaclass call.
+ISSUE_STATES_BY_VALUE: Mapping[str, IssueState] = {state.value: state for state in IssueState}
+ISSUE_STATE_REASONS_BY_VALUE: Mapping[str, IssueStateReason] = {
+    reason.value: reason for reason in IssueStateReason
+}
+
+
+class ResponseCache:
+    """On-disk store of GET responses, revalidated with ETags.
+
+    GitHub answers `If-None-Match` with `304 Not Modified` when nothing changed,
+    and such responses do not count against the rate limit. Entries older than
+    `max_age_seconds` are ignored, and the directory is trimmed to `max_bytes`
+    (oldest first) the first time each cache instance writes.
+
+    Entries are keyed on `scope` as well as the URL; `GitHubClient` passes a
+    fingerprint of its token so one credential never revalidates against, or
+    reads, a response fetched with another.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_age_seconds: int = _CACHE_MAX_AGE_SECONDS,
+        max_bytes: int = _CACHE_MAX_BYTES,
+    ) -> None:
+        self._directory = directory
+        self._max_age_seconds = max_age_seconds
+        self._max_bytes = max_bytes
+        self._pruned = False
+
+    def get(self, url: str, *, scope: str = "") -> tuple[str, Any, dict[str, str]] | None:
+        try:
+            entry = _json_loads(self._entry_path(url, scope).read_bytes())
+        except (OSError, ValueError):
+            return None
+        # Truncated, hand-edited or outdated entries are plain misses.
+        if (
+            not isinstance(entry, dict)
+            or entry.get("url") != url
+            or not isinstance(entry.get("etag"), str)
+            or "body" not in entry
+            or not isinstance(entry.get("headers"), dict)
+            or not isinstance(entry.get("stored_at"), (int, float))
+            or time.time() - entry["stored_at"] > self._max_age_seconds
+        ):
+            return None
+        return entry["etag"], entry["body"], entry["headers"]
+
+    def put(
+        self, url: str, etag: str, body: Any, headers: Mapping[str, str], *, scope: str = ""
+    ) -> None:
+        entry = {
+            "url": url,
+            "etag": etag,
+            "body": body,
+            "headers": dict(headers),
+            "stored_at": time.time(),
+        }
+        path = self._entry_path(url, scope)
+        # Best-effort: a cache that cannot be written only costs a full response.
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if not self._pruned:
+                self._pruned = True
+                self._prune()
+            with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as handle:
+                json.dump(entry, handle)
+            os.replace(handle.name, path)
+        except OSError:
+            return
+
+    def _prune(self) -> None:
+        """Drop expired entries, then the oldest ones until under the size budget."""
+        entries: list[tuple[float, int, str]] = []
+        with os.scandir(self._directory) as iterator:
+            for dir_entry in iterator:
+                if not dir_entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = dir_entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+        entries.sort(reverse=True)
+        expires_before = time.time() - self._max_age_seconds
+        total_bytes = 0
+        for mtime, size, entry_path in entries:
+            total_bytes += size
+            if mtime < expires_before or total_bytes > self._max_bytes:
+                try:
+                    os.remove(entry_path)
+                except OSError:
+                    continue
+
+    def _entry_path(self, url: str, scope: str) -> Path:
+        key = hashlib.sha256(f"{scope}\n{url}".encode()).hexdigest()
+        return self._directory / f"{key}.json"
+
+
+def default_response_cache() -> ResponseCache:
+    """Return the per-user response cache.
+
+    Lives under `$XDG_CACHE_HOME/planhub/github`, defaulting to `~/.cache/planhub/github`.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME", "")
+    # The XDG spec says relative values are invalid and must be ignored.
+    if not os.path.isabs(cache_home):
+        cache_home = os.path.join(os.path.expanduser("~"), ".cache")
+    return ResponseCache(Path(cache_home) / "planhub" / "github")
+
+
 def _create_session(max_retries: int = 3) -> requests.Session:
     """Create a requests session with connection pooling and retry logic."""
+    # Imported lazily: `requests` dominates import time, and commands that only
+    # need the enums here (via planhub.documents) never open a session.
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
     session = requests.Session()
     retry_strategy = Retry(
         total=max_retries,
@@ -58,10 +200,15 @@ class GitHubClient:
         token: str,
         base_url: str = "https://api.github.com",
         session: requests.Session | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         self._token = token
         self._base_url = base_url.rstrip("/")
         self._session = session or _create_session()
+        self._cache = cache
+        self._cache_scope = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        self._rate_limit_remaining: int | None = None
+        self._rate_limit_reset: int | None = None
         self._session.headers.update(
             {
                 "Accept": "application/vnd.github+json",
@@ -70,28 +217,30 @@ class GitHubClient:
             }
         )
 
+    @property
+    def rate_limit_remaining(self) -> int | None:
+        """Requests left in the current rate-limit window, per the last response."""
+        return self._rate_limit_remaining
+
     def create_issue(
         self,
         owner: str,
         repo: str,
         title: str,
         body: str | None = None,
-        labels: list[str] | None = None,
-        assignees: list[str] | None = None,
+        labels: Sequence[str] | None = None,
+        assignees: Sequence[str] | None = None,
         milestone: int | None = None,
         issue_type: str | None = None,
     ) -> Mapping[str, Any]:
-        payload: dict[str, Any] = {"title": title}
-        if body is not None:
-            payload["body"] = body
-        if labels is not None:
-            payload["labels"] = labels
-        if assignees is not None:
-            payload["assignees"] = assignees
-        if milestone is not None:
-            payload["milestone"] = milestone
-        if issue_type is not None:
-            payload["type"] = issue_type
+        payload = _without_none(
+            title=title,
+            body=body,
+            labels=labels,
+            assignees=assignees,
+            milestone=milestone,
+            type=issue_type,
+        )
         return self._request("POST", f"/repos/{owner}/{repo}/issues", payload)
 
     def get_issue(self, owner: str, repo: str, number: int) -> Mapping[str, Any]:
@@ -118,23 +267,15 @@ class GitHubClient:
         *,
         title: str | None = None,
         body: str | None = None,
-        labels: list[str] | None = None,
-        assignees: list[str] | None = None,
+        labels: Sequence[str] | None = None,
+        assignees: Sequence[str] | None = None,
         milestone: int | None = None,
         clear_milestone: bool = False,
         issue_type: str | None = None,
         state: IssueState | None = None,
         state_reason: IssueStateReason | None = None,
     ) -> Mapping[str, Any]:
-        payload: dict[str, Any] = {}
-        if title is not None:
-            payload["title"] = title
-        if body is not None:
-            payload["body"] = body
-        if labels is not None:
-            payload["labels"] = labels
-        if assignees is not None:
-            payload["assignees"] = assignees
+        payload = _without_none(title=title, body=body, labels=labels, assignees=assignees)
         if milestone is not None or clear_milestone:
             payload["milestone"] = milestone
         if issue_type is not None:
@@ -146,23 +287,42 @@ class GitHubClient:
         return self._request("PATCH", f"/repos/{owner}/{repo}/issues/{number}", payload)
 
     def list_issues(self, owner: str, repo: str, state: str = "open") -> list[Mapping[str, Any]]:
-        issues: list[Mapping[str, Any]] = []
-        page = 1
-        while True:
-            path = f"/repos/{owner}/{repo}/issues?state={state}&per_page=100&page={page}"
-            data, headers = self._request_with_headers("GET", path)
-            if not isinstance(data, list):
-                raise GitHubAPIError(
-                    status_code=500,
-                    message="Unexpected issues response.",
-                    response_body={"data": data},
+        path = f"/repos/{owner}/{repo}/issues?state={state}&per_page=100"
+        issues, headers = self._get_list_page(path, 1)
+        link_header = headers.get("Link")
+        last_page = _last_page(link_header)
+        if last_page is not None and last_page > 1:
+            # The page count is known up front, so fetch the rest concurrently.
+            from concurrent.futures import ThreadPoolExecutor
+
+            workers = min(_PAGE_FETCH_WORKERS, last_page - 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pages = executor.map(
+                    lambda page: self._get_list_page(path, page), range(2, last_page + 1)
                 )
-            issues.extend(data)
-            if not _has_next_link(headers.get("Link")):
-                break
+                for data, _headers in pages:
+                    issues.extend(data)
+            return issues
+        page = 1
+        while _has_next_link(link_header):
             page += 1
+            data, headers = self._get_list_page(path, page)
+            issues.extend(data)
+            link_header = headers.get("Link")
         return issues
 
+    def _get_list_page(
+        self, path: str, page: int
+    ) -> tuple[list[Mapping[str, Any]], Mapping[str, str]]:
+        data, headers = self._request_with_headers("GET", f"{path}&page={page}")
+        if not isinstance(data, list):
+            raise GitHubAPIError(
+                status_code=500,
+                message="Unexpected issues response.",
+                response_body={"data": data},
+            )
+        return data, headers
+
     def close_issue(
         self,
         owner: str,
@@ -186,13 +346,7 @@ class GitHubClient:
         due_on: str | None = None,
         state: str | None = None,
     ) -> Mapping[str, Any]:
-        payload: dict[str, Any] = {"title": title}
-        if description is not None:
-            payload["description"] = description
-        if due_on is not None:
-            payload["due_on"] = due_on
-        if state is not None:
-            payload["state"] = state
+        payload = _without_none(title=title, description=description, due_on=due_on, state=state)
         return self._request("POST", f"/repos/{owner}/{repo}/milestones", payload)
 
     def update_milestone(
@@ -206,15 +360,7 @@ class GitHubClient:
         due_on: str | None = None,
         state: str | None = None,
     ) -> Mapping[str, Any]:
-        payload: dict[str, Any] = {}
-        if title is not None:
-            payload["title"] = title
-        if description is not None:
-            payload["description"] = description
-        if due_on is not None:
-            payload["due_on"] = due_on
-        if state is not None:
-            payload["state"] = state
+        payload = _without_none(title=title, description=description, due_on=due_on, state=state)
         return self._request("PATCH", f"/repos/{owner}/{repo}/milestones/{number}", payload)
 
     def _request(self, method: str, path: str, payload: Mapping[str, Any] | None = None) -> Any:
@@ -225,11 +371,22 @@ class GitHubClient:
         self, method: str, path: str, payload: Mapping[str, Any] | None = None
     ) -> tuple[Any, Mapping[str, str]]:
         url = f"{self._base_url}{path}"
-        response = self._request_once(method, url, payload)
-        wait_seconds = self._handle_rate_limit(response)
-        if wait_seconds is not None:
+        cached = (
+            self._cache.get(url, scope=self._cache_scope)
+            if self._cache is not None and method == "GET"
+            else None
+        )
+        request_headers = {"If-None-Match": cached[0]} if cached is not None else None
+        self._wait_for_rate_limit_reset()
+        response = self._request_once(method, url, payload, request_headers)
+        for _attempt in range(_MAX_RATE_LIMIT_RETRIES):
+            wait_seconds = self._handle_rate_limit(response)
+            if wait_seconds is None:
+                break
             time.sleep(wait_seconds)
-            response = self._request_once(method, url, payload)
+            response = self._request_once(method, url, payload, request_headers)
+        if cached is not None and response.status_code == 304:
+            return cached[1], cached[2]
         if not response.ok:
             body = self._parse_body(response.content)
             message = "unknown error"
@@ -239,22 +396,51 @@ class GitHubClient:
                 status_code=response.status_code, message=message, response_body=body
             )
         headers = dict(response.headers)
-        return self._parse_body(response.content), headers
+        data = self._parse_body(response.content)
+        etag = response.headers.get("ETag")
+        if self._cache is not None and method == "GET" and etag:
+            self._cache.put(url, etag, data, headers, scope=self._cache_scope)
+        return data, headers
 
     def _request_once(
-        self, method: str, url: str, payload: Mapping[str, Any] | None
+        self,
+        method: str,
+        url: str,
+        payload: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None = None,
     ) -> requests.Response:
-        return self._session.request(
+        response = self._session.request(
             method=method,
             url=url,
             json=payload,
+            headers=headers,
             timeout=30,
         )
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.isdigit():
+            self._rate_limit_remaining = int(remaining)
+        reset_time = response.headers.get("X-RateLimit-Reset")
+        if reset_time is not None and reset_time.isdigit():
+            self._rate_limit_reset = int(reset_time)
+        return response
+
+    def _wait_for_rate_limit_reset(self) -> None:
+        """Sleep through a short reset window instead of spending a request on a 403."""
+        if self._rate_limit_remaining != 0 or self._rate_limit_reset is None:
+            return
+        wait_seconds = self._rate_limit_reset - int(time.time()) + 1
+        # Longer waits are left to _handle_rate_limit, which reports them as errors.
+        if 0 < wait_seconds <= 60:
+            time.sleep(wait_seconds)
 
     def _handle_rate_limit(self, response: requests.Response) -> int | None:
         """Return wait time in seconds when rate limited, otherwise None."""
         if response.status_code == 403:
             remaining = response.headers.get("X-RateLimit-Remaining")
+            retry_after = response.headers.get("Retry-After")
+            if remaining != "0" and retry_after is not None:
+                # Secondary rate limit: GitHub says how long to back off.
+                return _retry_after_seconds(retry_after)
             if remaining == "0":
                 reset_time = response.headers.get("X-RateLimit-Reset")
                 if reset_time:
@@ -267,24 +453,50 @@ class GitHubClient:
                     response_body=None,
                 )
         elif response.status_code == 429:
-            retry_after = response.headers.get("Retry-After", "60")
-            wait_seconds = min(int(retry_after), 60)
-            return wait_seconds
+            return _retry_after_seconds(response.headers.get("Retry-After"))
         return None
 
     @staticmethod
     def _parse_body(raw_body: bytes) -> Any:
         if not raw_body:
             return {}
-        import json
+        return _json_loads(raw_body)
 
-        return json.loads(raw_body.decode("utf-8"))
 
+def _without_none(**fields: Any) -> dict[str, Any]:
+    """Build a request payload from the fields that were actually given."""
+    return {key: value for key, value in fields.items() if value is not None}
 
-def _has_next_link(link_header: str | None) -> bool:
+
+def _retry_after_seconds(retry_after: str | None) -> int:
+    """Seconds to wait per a Retry-After header, capped at 60.
+
+    The header is either delta-seconds or an HTTP-date; anything unparseable
+    falls back to the full 60-second backoff.
+    """
+    if retry_after is None:
+        return _MAX_RETRY_AFTER_SECONDS
+    retry_after = retry_after.strip()
+    if retry_after.isdigit():
+        return min(int(retry_after), _MAX_RETRY_AFTER_SECONDS)
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return _MAX_RETRY_AFTER_SECONDS
+    if retry_at.tzinfo is None:
+        # RFC 9110 dates are GMT; "-0000" parses as naive.
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    wait_seconds = math.ceil((retry_at - datetime.now(timezone.utc)).total_seconds())
+    return min(max(wait_seconds, 0), _MAX_RETRY_AFTER_SECONDS)
+
+
+def _last_page(link_header: str | None) -> int | None:
     if not link_header:
-        return False
-    for part in link_header.split(","):
-        if 'rel="next"' in part:
-            return True
-    return False
+        return None
+    match = _LAST_PAGE_RE.search(link_header)
+    return int(match.group(1)) if match else None
+
+
+def _has_next_link(link_header: str | None) -> bool:
+    # Each rel appears at most once in GitHub's Link header, so no need to split it.
+    return bool(link_header) and 'rel="next"' in link_header
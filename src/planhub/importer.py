@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import os
+import re
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -14,6 +16,12 @@ from planhub.documents import (
     render_markdown,
     update_front_matter,
 )
+from planhub.github import (
+    ISSUE_STATE_REASONS_BY_VALUE,
+    ISSUE_STATES_BY_VALUE,
+    IssueState,
+    IssueStateReason,
+)
 from planhub.layout import PlanLayout, discover_milestones, discover_root_issues
 from planhub.slug import slugify
 
@@ -33,14 +41,27 @@ def import_existing_issues(
     *,
     client: Any,
     dry_run: bool,
+    issues: Sequence[Mapping[str, Any]] | None = None,
 ) -> ImportResult:
-    issues = client.list_issues(owner, repo, state="all")
+    """Create or move local issue files to mirror the repository's GitHub issues.
+
+    Callers that already hold a `list_issues(state="all")` listing pass it as
+    `issues` so the repository is not paginated twice.
+    """
+    if issues is None:
+        issues = client.list_issues(owner, repo, state="all")
     issues_created = 0
     issues_moved = 0
     milestones_created = 0
     issues_skipped = 0
-    existing_issues = _collect_existing_issues(layout)
-    existing_by_content = _collect_existing_by_content(layout)
+    existing_issues, existing_by_content = _collect_existing(layout)
+    # Casefolded file names per target directory, scanned once instead of stat'ing
+    # each candidate. Moves and writes below keep the sets current.
+    names_by_dir: dict[Path, set[str]] = {}
+    # Directories already made this run, so each one is mkdir'd once.
+    created_dirs: set[Path] = set()
+    # Issues fan in to a few milestones; resolve each milestone directory once.
+    milestone_dirs: dict[str, tuple[Path, bool] | None] = {}
 
     for issue in issues:
         if issue.get("pull_request"):
@@ -57,13 +78,21 @@ def import_existing_issues(
         if milestone:
             milestone_title = milestone.get("title")
             if milestone_title:
-                milestone_dir = _ensure_milestone_dir(layout, milestone, dry_run=dry_run)
-                if milestone_dir and milestone_dir[1]:
-                    milestones_created += 1
+                milestone_key = str(milestone_title).strip()
+                if milestone_key in milestone_dirs:
+                    milestone_dir = milestone_dirs[milestone_key]
+                else:
+                    milestone_dir = _ensure_milestone_dir(
+                        layout, milestone, dry_run=dry_run, created_dirs=created_dirs
+                    )
+                    if milestone_dir and milestone_dir[1]:
+                        milestones_created += 1
+                    # Later issues find the milestone in place, as a real run would.
+                    milestone_dirs[milestone_key] = milestone_dir and (milestone_dir[0], False)
 
         if number in existing_issues:
             existing_path = existing_issues[number]
-            if _maybe_move_issue(existing_path, milestone_dir, dry_run=dry_run):
+            if _maybe_move_issue(existing_path, milestone_dir, names_by_dir, dry_run=dry_run):
                 issues_moved += 1
             else:
                 issues_skipped += 1
@@ -74,7 +103,7 @@ def import_existing_issues(
                 existing_path = existing_by_content[content_key]
                 if not dry_run:
                     update_front_matter(existing_path, {"number": number})
-                if _maybe_move_issue(existing_path, milestone_dir, dry_run=dry_run):
+                if _maybe_move_issue(existing_path, milestone_dir, names_by_dir, dry_run=dry_run):
                     issues_moved += 1
                 else:
                     issues_skipped += 1
@@ -88,14 +117,13 @@ def import_existing_issues(
             continue
 
         target_dir = milestone_dir[0] if milestone_dir else layout.issues_dir
-        issue_path = _issue_path_for_import(target_dir, issue)
-        if issue_path.exists():
-            issues_skipped += 1
-            continue
+        taken_names = _taken_names(names_by_dir, target_dir)
+        issue_path = _issue_path_for_import(target_dir, issue, taken_names)
+        taken_names.add(issue_path.name.casefold())
 
         issue_doc = _issue_document_from_api(issue, issue_path, milestone_title=milestone_title)
         if not dry_run:
-            _write_issue(issue_doc)
+            _write_issue(issue_doc, created_dirs)
         issues_created += 1
 
     return ImportResult(
@@ -107,7 +135,11 @@ def import_existing_issues(
 
 
 def _ensure_milestone_dir(
-    layout: PlanLayout, milestone: Mapping[str, Any], *, dry_run: bool
+    layout: PlanLayout,
+    milestone: Mapping[str, Any],
+    *,
+    dry_run: bool,
+    created_dirs: set[Path],
 ) -> tuple[Path, bool] | None:
     title = milestone.get("title")
     if not title:
@@ -118,22 +150,23 @@ def _ensure_milestone_dir(
     created = False
     if not milestone_dir.exists():
         if not dry_run:
-            milestone_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(milestone_dir, created_dirs)
         created = True
     if not milestone_path.exists():
         milestone_doc = _milestone_document_from_api(milestone, milestone_path)
         if not dry_run:
-            _write_milestone(milestone_doc)
+            _write_milestone(milestone_doc, created_dirs)
         created = True
     issues_dir = milestone_dir / "issues"
     if not issues_dir.exists() and not dry_run:
-        issues_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(issues_dir, created_dirs)
     return issues_dir, created
 
 
 def _maybe_move_issue(
     existing_path: Path,
     milestone_dir: tuple[Path, bool] | None,
+    names_by_dir: dict[Path, set[str]],
     *,
     dry_run: bool,
 ) -> bool:
@@ -143,50 +176,38 @@ def _maybe_move_issue(
     target_path = target_dir / existing_path.name
     if existing_path == target_path or target_path.exists():
         return False
+    taken_names = _taken_names(names_by_dir, target_dir)
     if not dry_run:
         target_dir.mkdir(parents=True, exist_ok=True)
         existing_path.rename(target_path)
+    # New issues written later must not reuse the moved file's name.
+    taken_names.add(existing_path.name.casefold())
     return True
 
 
-def _collect_existing_issues(layout: PlanLayout) -> dict[int, Path]:
-    numbers: dict[int, Path] = {}
-    for issue_path in discover_root_issues(layout):
-        _try_add_issue_number(issue_path, numbers)
-    for entry in discover_milestones(layout):
-        for issue_path in entry.issue_files:
-            _try_add_issue_number(issue_path, numbers)
-    return numbers
-
-
-def _collect_existing_by_content(layout: PlanLayout) -> dict[tuple[str, str], Path]:
-    entries: dict[tuple[str, str], Path] = {}
-    for issue_path in discover_root_issues(layout):
-        _try_add_issue_content(issue_path, entries)
-    for entry in discover_milestones(layout):
-        for issue_path in entry.issue_files:
-            _try_add_issue_content(issue_path, entries)
-    return entries
-
-
-def _try_add_issue_number(issue_path: Path, numbers: dict[int, Path]) -> None:
-    try:
-        issue_doc = load_issue_document(issue_path)
-    except DocumentError:
-        return
-    if issue_doc.number is not None:
-        numbers.setdefault(issue_doc.number, issue_path)
-
+def _collect_existing(
+    layout: PlanLayout,
+) -> tuple[dict[int, Path], dict[tuple[str, str], Path]]:
+    """Index local issues by number and, for unsynced ones, by content.
 
-def _try_add_issue_content(issue_path: Path, entries: dict[tuple[str, str], Path]) -> None:
-    try:
-        issue_doc = load_issue_document(issue_path)
-    except DocumentError:
-        return
-    if issue_doc.number is not None:
-        return
-    key = _content_key(issue_doc.title, issue_doc.body)
-    entries.setdefault(key, issue_path)
+    Both indexes come from a single pass so each file is discovered and parsed once.
+    """
+    numbers: dict[int, Path] = {}
+    by_content: dict[tuple[str, str], Path] = {}
+    issue_paths = [
+        *discover_root_issues(layout),
+        *(issue_path for entry in discover_milestones(layout) for issue_path in entry.issue_files),
+    ]
+    for issue_path in issue_paths:
+        try:
+            issue_doc = load_issue_document(issue_path)
+        except DocumentError:
+            continue
+        if issue_doc.number is not None:
+            numbers.setdefault(issue_doc.number, issue_path)
+        else:
+            by_content.setdefault(_content_key(issue_doc.title, issue_doc.body), issue_path)
+    return numbers, by_content
 
 
 def _content_key(title: str, body: str | None) -> tuple[str, str]:
@@ -232,7 +253,7 @@ def _milestone_document_from_api(milestone: Mapping[str, Any], path: Path) -> Mi
     )
 
 
-def _write_issue(issue: IssueDocument) -> None:
+def _write_issue(issue: IssueDocument, created_dirs: set[Path]) -> None:
     front_matter: dict[str, Any] = {"title": issue.title, "number": issue.number}
     if issue.labels:
         front_matter["labels"] = list(issue.labels)
@@ -247,11 +268,11 @@ def _write_issue(issue: IssueDocument) -> None:
     if issue.state_reason:
         front_matter["state_reason"] = issue.state_reason.value
     content = render_markdown(front_matter, issue.body)
-    issue.path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(issue.path.parent, created_dirs)
     issue.path.write_text(content, encoding="utf-8")
 
 
-def _write_milestone(milestone: MilestoneDocument) -> None:
+def _write_milestone(milestone: MilestoneDocument, created_dirs: set[Path]) -> None:
     front_matter: dict[str, Any] = {"title": milestone.title, "number": milestone.number}
     if milestone.description:
         front_matter["description"] = milestone.description
@@ -260,34 +281,65 @@ def _write_milestone(milestone: MilestoneDocument) -> None:
     if milestone.state:
         front_matter["state"] = milestone.state.value
     content = render_markdown(front_matter, "")
-    milestone.path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(milestone.path.parent, created_dirs)
     milestone.path.write_text(content, encoding="utf-8")
 
 
-def _issue_path_for_import(directory: Path, issue: Mapping[str, Any]) -> Path:
+def _ensure_dir(directory: Path, created_dirs: set[Path]) -> None:
+    if directory in created_dirs:
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    created_dirs.add(directory)
+
+
+def _issue_path_for_import(
+    directory: Path, issue: Mapping[str, Any], taken_names: set[str]
+) -> Path:
     created_at = issue.get("created_at")
     created_at_str = _format_date(created_at)
     title = slugify(str(issue.get("title", "")).strip(), fallback="milestone") or "issue"
     base_name = f"{created_at_str}-{title}"
-    path = directory / f"{base_name}.md"
-    if not path.exists():
-        return path
+    name = f"{base_name}.md"
+    if name.casefold() not in taken_names:
+        return directory / name
     number = issue.get("number")
     if number:
-        with_number = directory / f"{base_name}-{number}.md"
-        if not with_number.exists():
-            return with_number
+        name = f"{base_name}-{number}.md"
+        if name.casefold() not in taken_names:
+            return directory / name
     index = 2
-    while True:
-        candidate = directory / f"{base_name}-{index}.md"
-        if not candidate.exists():
-            return candidate
+    while f"{base_name}-{index}.md".casefold() in taken_names:
         index += 1
+    return directory / f"{base_name}-{index}.md"
+
+
+def _taken_names(names_by_dir: dict[Path, set[str]], directory: Path) -> set[str]:
+    taken_names = names_by_dir.get(directory)
+    if taken_names is None:
+        taken_names = names_by_dir[directory] = _file_names(directory)
+    return taken_names
+
+
+def _file_names(directory: Path) -> set[str]:
+    # Casefolded so names differing only by case collide, as they do on
+    # case-insensitive filesystems (macOS, Windows).
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name.casefold() for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+# GitHub timestamps are always UTC in this exact shape.
+_GITHUB_TIMESTAMP_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})T\d{2}:\d{2}:\d{2}Z")
 
 
 def _format_date(value: str | None) -> str:
     if not value:
         return "00000000"
+    match = _GITHUB_TIMESTAMP_RE.fullmatch(value)
+    if match:
+        return "".join(match.groups())
     try:
         parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
     except ValueError:
@@ -295,13 +347,15 @@ def _format_date(value: str | None) -> str:
     return parsed.strftime("%Y%m%d")
 
 
-def _parse_state(value: str):
-    from planhub.github import IssueState
-
-    return IssueState(value)
-
+def _parse_state(value: str) -> IssueState:
+    state = ISSUE_STATES_BY_VALUE.get(value)
+    if state is None:
+        raise ValueError(f"Unknown issue state '{value}'.")
+    return state
 
-def _parse_state_reason(value: str):
-    from planhub.github import IssueStateReason
 
-    return IssueStateReason(value)
+def _parse_state_reason(value: str) -> IssueStateReason:
+    reason = ISSUE_STATE_REASONS_BY_VALUE.get(value)
+    if reason is None:
+        raise ValueError(f"Unknown issue state_reason '{value}'.")
+    return reason
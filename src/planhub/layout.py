@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -23,6 +23,7 @@ class MilestoneEntry:
     directory: Path
     milestone_file: Path
     issue_files: tuple[Path, ...]
+    has_milestone_file: bool
 
 
 def ensure_layout(repo_root: Path) -> PlanLayout:
@@ -50,29 +51,46 @@ def load_layout(repo_root: Path) -> PlanLayout:
 def discover_milestones(layout: PlanLayout) -> tuple[MilestoneEntry, ...]:
     entries: list[MilestoneEntry] = []
     for milestone_dir in _sorted_dirs(layout.milestones_dir):
-        milestone_file = milestone_dir / MILESTONE_FILENAME
-        issue_files = _sorted_files(milestone_dir / ISSUES_DIR_NAME, "*.md")
+        has_milestone_file = False
+        issue_files: tuple[Path, ...] = ()
+        # One scandir per milestone answers both lookups from cached entry types.
+        for dir_entry in _scandir(milestone_dir):
+            if dir_entry.name == MILESTONE_FILENAME:
+                has_milestone_file = dir_entry.is_file()
+            elif dir_entry.name == ISSUES_DIR_NAME and dir_entry.is_dir():
+                issue_files = _sorted_files(milestone_dir / ISSUES_DIR_NAME, ".md")
         entries.append(
             MilestoneEntry(
                 directory=milestone_dir,
-                milestone_file=milestone_file,
+                milestone_file=milestone_dir / MILESTONE_FILENAME,
                 issue_files=issue_files,
+                has_milestone_file=has_milestone_file,
             )
         )
     return tuple(entries)
 
 
 def discover_root_issues(layout: PlanLayout) -> tuple[Path, ...]:
-    return _sorted_files(layout.issues_dir, "*.md")
+    return _sorted_files(layout.issues_dir, ".md")
 
 
-def _sorted_dirs(directory: Path) -> Iterable[Path]:
-    if not directory.exists():
+def _scandir(directory: Path) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(directory) as iterator:
+            return list(iterator)
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted([path for path in directory.iterdir() if path.is_dir()])
 
 
-def _sorted_files(directory: Path, pattern: str) -> tuple[Path, ...]:
-    if not directory.exists():
-        return ()
-    return tuple(sorted(directory.glob(pattern)))
+def _sorted_dirs(directory: Path) -> list[Path]:
+    return sorted(directory / entry.name for entry in _scandir(directory) if entry.is_dir())
+
+
+def _sorted_files(directory: Path, suffix: str) -> tuple[Path, ...]:
+    return tuple(
+        sorted(
+            directory / entry.name
+            for entry in _scandir(directory)
+            if entry.name.endswith(suffix) and entry.is_file()
+        )
+    )
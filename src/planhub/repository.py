@@ -1,19 +1,30 @@
 from __future__ import annotations
 
+import re
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
+# Remote URLs and git config syntax are ASCII; git's own whitespace rules are too.
+_GITHUB_REMOTE_PREFIX_RE = re.compile(r"git@github\.com:|https://(?:www\.)?github\.com/", re.ASCII)
+_SECTION_RE = re.compile(r"\[[^\]]*\]", re.ASCII)
+_ORIGIN_SECTION_RE = re.compile(r'\[\s*(?i:remote)\s+"origin"\s*\]', re.ASCII)
+_URL_KEY_RE = re.compile(r"(?i:url)\s*=\s*(.*)", re.ASCII)
+# Config features that only git itself resolves correctly.
+_UNSUPPORTED_CONFIG_RE = re.compile(
+    r"^\s*\[\s*include|worktreeconfig", re.ASCII | re.IGNORECASE | re.MULTILINE
+)
+
 
 def get_github_repo_from_git(repo_root: Path) -> tuple[str, str]:
-    result = subprocess.run(
-        ["git", "config", "--get", "remote.origin.url"],
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    url = result.stdout.strip()
-    if result.returncode != 0 or not url:
+    return _github_repo_from_git(repo_root.resolve())
+
+
+# The remote does not change during a CLI run; failed lookups raise and are not cached.
+@lru_cache(maxsize=32)
+def _github_repo_from_git(repo_root: Path) -> tuple[str, str]:
+    url = _read_origin_url(repo_root) or _git_config_origin_url(repo_root)
+    if not url:
         raise ValueError("Missing git remote origin URL.")
 
     parsed = parse_github_remote(url)
@@ -23,18 +34,83 @@ def get_github_repo_from_git(repo_root: Path) -> tuple[str, str]:
 
 
 def parse_github_remote(url: str) -> tuple[str, str] | None:
-    if url.startswith("git@github.com:"):
-        path = url.replace("git@github.com:", "", 1)
-    elif url.startswith("https://github.com/"):
-        path = url.replace("https://github.com/", "", 1)
-    elif url.startswith("https://www.github.com/"):
-        path = url.replace("https://www.github.com/", "", 1)
-    else:
+    prefix = _GITHUB_REMOTE_PREFIX_RE.match(url)
+    if prefix is None:
         return None
 
-    if path.endswith(".git"):
-        path = path[: -len(".git")]
+    path = url[prefix.end() :].removesuffix(".git")
     parts = [part for part in path.split("/") if part]
     if len(parts) != 2:
         return None
     return parts[0], parts[1]
+
+
+def _git_config_origin_url(repo_root: Path) -> str | None:
+    result = subprocess.run(
+        ["git", "config", "--get", "remote.origin.url"],
+        cwd=repo_root,
+        # Only stdout is used; not piping stderr leaves a single pipe to drain.
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def _read_origin_url(repo_root: Path) -> str | None:
+    """Read remote.origin.url from the repository's config file without spawning git.
+
+    Returns None whenever the plain file cannot answer reliably (no `.git` in
+    repo_root, includes, quoting or escapes), leaving the lookup to `git config`.
+    """
+    config_path = _git_config_path(repo_root)
+    if config_path is None:
+        return None
+    try:
+        text = config_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    if _UNSUPPORTED_CONFIG_RE.search(text):
+        return None
+
+    url = None
+    in_origin = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if _SECTION_RE.match(stripped):
+            in_origin = _ORIGIN_SECTION_RE.fullmatch(stripped) is not None
+            continue
+        if not in_origin:
+            continue
+        match = _URL_KEY_RE.fullmatch(stripped)
+        if match is None:
+            continue
+        value = match.group(1)
+        if any(char in value for char in '"\\#;'):
+            return None
+        # Like `git config --get`, the last value wins.
+        url = value
+    return url
+
+
+def _git_config_path(repo_root: Path) -> Path | None:
+    git_path = repo_root / ".git"
+    if git_path.is_dir():
+        return git_path / "config"
+    # Worktrees and submodules have a `.git` file pointing at the real git dir.
+    try:
+        pointer = git_path.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not pointer.startswith("gitdir:"):
+        return None
+    git_dir = repo_root / pointer[len("gitdir:") :].strip()
+    try:
+        common_dir = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return git_dir / "config"
+    # Linked worktrees share the main repository's config.
+    return git_dir / common_dir / "config"
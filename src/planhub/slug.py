@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
+_SEPARATORS = str.maketrans({" ": "-", "_": "-"})
+# `\w` is `str.isalnum()` plus "_", and underscores are already translated.
+_DISALLOWED_RE = re.compile(r"[^\w-]+")
+_DASHES_RE = re.compile(r"-+")
 
+
+# Imports slugify every issue's milestone title, so the same few titles repeat.
+@lru_cache(maxsize=1024)
 def slugify(value: str, *, fallback: str) -> str:
     """Convert a string to a stable slug with a caller-defined fallback."""
-    slug: list[str] = []
-    for char in value.lower():
-        if char.isalnum():
-            slug.append(char)
-        elif char in {" ", "-", "_"}:
-            slug.append("-")
-    normalized = "".join(slug).strip("-")
-    normalized = re.sub(r"-+", "-", normalized)
+    normalized = _DISALLOWED_RE.sub("", value.lower().translate(_SEPARATORS))
+    normalized = _DASHES_RE.sub("-", normalized.strip("-"))
     return normalized or fallback
@@ -2,9 +2,28 @@ from __future__ import annotations
 
 import pytest
 
+from planhub.auth import _get_token_from_gh
+from planhub.repository import _github_repo_from_git
+
 
 @pytest.fixture(autouse=True)
 def _isolate_home(monkeypatch, tmp_path):
     # Prevent tests from reading any real user `~/.planhub/config.yaml`.
     monkeypatch.setenv("HOME", str(tmp_path))
     yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_gh_token_cache():
+    # The `gh` token lookup is memoized per process; keep tests independent.
+    _get_token_from_gh.cache_clear()
+    yield
+    _get_token_from_gh.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_git_remote_cache():
+    # Owner/repo lookups are memoized per repository root; keep tests independent.
+    _github_repo_from_git.cache_clear()
+    yield
+    _github_repo_from_git.cache_clear()
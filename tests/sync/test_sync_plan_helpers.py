@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import MagicMock
 
+from planhub.cli import sync_plan
 from planhub.cli.sync_plan import (
+    SyncPlan,
     _state_updates_from_github_issue,
+    _worker_count,
     archive_closed_issues_in_filesystem,
+    build_sync_plan,
+    reconcile_milestone_archive_locations,
 )
 from planhub.config import (
     PlanHubConfig,
@@ -13,6 +19,7 @@ from planhub.config import (
     SyncConfig,
     SyncGithubConfig,
 )
+from planhub.documents import load_issue_document
 from planhub.layout import ensure_layout
 
 
@@ -179,6 +186,64 @@ def test_archive_closed_issues_delete_policy_counts_deletions(tmp_path) -> None:
     assert stats.archived_count == 0
 
 
+def test_build_sync_plan_reports_missing_milestone_file_and_skips_non_markdown(tmp_path) -> None:
+    layout = ensure_layout(tmp_path)
+    issues_dir = layout.milestones_dir / "stage-1" / "issues"
+    issues_dir.mkdir(parents=True, exist_ok=True)
+    (issues_dir / "issue.md").write_text('---\ntitle: "Issue"\n---\n', encoding="utf-8")
+    (layout.issues_dir / "notes.txt").write_text("not an issue", encoding="utf-8")
+    (layout.issues_dir / "drafts.md").mkdir()
+
+    plan, parsed_milestones, parsed_issues, errors = build_sync_plan(layout)
+
+    assert errors == [f"{layout.milestones_dir / 'stage-1' / 'milestone.md'}: missing milestone.md"]
+    assert parsed_milestones == 0
+    assert parsed_issues == 0
+    assert plan.issues_to_create == []
+
+
+def test_build_sync_plan_leaves_documents_cached_for_later_phases(tmp_path) -> None:
+    layout = ensure_layout(tmp_path)
+    for index in range(4):
+        (layout.issues_dir / f"issue-{index}.md").write_text(
+            f'---\ntitle: "Issue {index}"\nnumber: {index + 1}\n---\n', encoding="utf-8"
+        )
+    (layout.issues_dir / "issue-9.md").write_text("---\nnumber: 10\n---\n", encoding="utf-8")
+
+    plan, _, parsed_issues, errors = build_sync_plan(layout)
+
+    assert parsed_issues == 4
+    assert [doc.title for _, doc, _ in plan.issues_to_update] == [
+        "Issue 0",
+        "Issue 1",
+        "Issue 2",
+        "Issue 3",
+    ]
+    assert errors == [f"{layout.issues_dir / 'issue-9.md'}: Missing or invalid 'title'."]
+    # The archive phase reloads these paths; it must get the parsed documents back.
+    for issue_path, issue_doc, _ in plan.issues_to_update:
+        assert load_issue_document(issue_path) is issue_doc
+
+
+def test_reconcile_milestones_skips_directories_without_milestone_file(tmp_path) -> None:
+    layout = ensure_layout(tmp_path)
+    (layout.milestones_dir / "stage-1" / "issues").mkdir(parents=True)
+    (layout.root / "archive" / "milestones" / "stage-0").mkdir(parents=True)
+    errors: list[str] = []
+
+    reconcile_milestone_archive_locations(
+        layout,
+        errors=errors,
+        dry_run=False,
+        move_open_to_active=True,
+        move_closed_to_archive=True,
+    )
+
+    assert errors == []
+    assert (layout.milestones_dir / "stage-1").is_dir()
+    assert (layout.root / "archive" / "milestones" / "stage-0").is_dir()
+
+
 def test_state_updates_from_github_issue_handles_open_and_closed_reason() -> None:
     assert _state_updates_from_github_issue({"state": "open"}) == {
         "state": "open",
@@ -193,3 +258,25 @@ def test_state_updates_from_github_issue_handles_open_and_closed_reason() -> Non
 def test_state_updates_from_github_issue_invalid_payload_returns_empty() -> None:
     assert _state_updates_from_github_issue(object()) == {}
     assert _state_updates_from_github_issue({"state": "something"}) == {}
+
+
+def test_sync_plan_finds_milestone_number_case_insensitively() -> None:
+    plan = SyncPlan()
+    plan.set_milestone_number("Stage 1", 7)
+
+    assert plan.find_milestone_number("Stage 1") == 7
+    assert plan.find_milestone_number("STAGE 1") == 7
+    assert plan.find_milestone_number("Stage 2") is None
+
+
+def test_worker_count_shrinks_with_rate_limit_budget() -> None:
+    client = MagicMock()
+
+    client.rate_limit_remaining = None
+    assert _worker_count(client) == sync_plan.MAX_WORKERS
+    client.rate_limit_remaining = 5000
+    assert _worker_count(client) == sync_plan.MAX_WORKERS
+    client.rate_limit_remaining = 250
+    assert _worker_count(client) == 2
+    client.rate_limit_remaining = 0
+    assert _worker_count(client) == 1
@@ -17,3 +17,23 @@ def test_get_auth_token_uses_gh(mock_run, monkeypatch) -> None:
     mock_run.return_value.stdout = "gh-token\n"
 
     assert get_auth_token() == "gh-token"
+
+
+@patch("planhub.auth.subprocess.run")
+def test_get_auth_token_runs_gh_once(mock_run, monkeypatch) -> None:
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    mock_run.return_value.returncode = 0
+    mock_run.return_value.stdout = "gh-token\n"
+
+    assert get_auth_token() == "gh-token"
+    assert get_auth_token() == "gh-token"
+    mock_run.assert_called_once()
+
+
+@patch("planhub.auth.subprocess.run", side_effect=FileNotFoundError)
+def test_get_auth_token_without_gh_installed(mock_run, monkeypatch) -> None:
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+
+    assert get_auth_token() is None
@@ -6,7 +6,7 @@ from typer.testing import CliRunner
 
 from planhub.cli.app import app
 
-cli_app_module = importlib.import_module("planhub.cli.app")
+sync_command_module = importlib.import_module("planhub.cli.commands.sync")
 
 
 def test_init_creates_layout(tmp_path, monkeypatch, capsys) -> None:
@@ -96,9 +96,9 @@ def test_sync_requires_layout(tmp_path, monkeypatch, capsys) -> None:
     assert "Run 'planhub init' first." in result.output
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_reports_counts(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch, capsys
 ) -> None:
@@ -130,9 +130,9 @@ def test_sync_reports_counts(
     assert "Parsed: 2 milestones, 2 issues." in result.output
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_counts_only_actual_modified_issue_files(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -262,7 +262,7 @@ def test_sync_compact_flag_overrides_verbose_config(tmp_path, monkeypatch) -> No
 
 def test_sync_rejects_conflicting_verbosity_flags(tmp_path, monkeypatch) -> None:
     mock_sync_command = Mock()
-    monkeypatch.setattr(cli_app_module, "sync_command", mock_sync_command)
+    monkeypatch.setattr(sync_command_module, "sync_command", mock_sync_command)
     monkeypatch.chdir(tmp_path)
     _create_milestone(
         tmp_path / ".plan" / "milestones" / "stage-1",
@@ -279,7 +279,7 @@ def test_sync_rejects_conflicting_verbosity_flags(tmp_path, monkeypatch) -> None
 
 def test_sync_cli_default_passes_no_verbosity_override(monkeypatch) -> None:
     mock_sync_command = Mock()
-    monkeypatch.setattr(cli_app_module, "sync_command", mock_sync_command)
+    monkeypatch.setattr(sync_command_module, "sync_command", mock_sync_command)
     runner = CliRunner()
     result = runner.invoke(app, ["sync", "--dry-run"])
 
@@ -289,7 +289,7 @@ def test_sync_cli_default_passes_no_verbosity_override(monkeypatch) -> None:
 
 def test_sync_cli_verbose_passes_verbosity_override(monkeypatch) -> None:
     mock_sync_command = Mock()
-    monkeypatch.setattr(cli_app_module, "sync_command", mock_sync_command)
+    monkeypatch.setattr(sync_command_module, "sync_command", mock_sync_command)
     runner = CliRunner()
     result = runner.invoke(app, ["sync", "--verbose"])
 
@@ -299,7 +299,7 @@ def test_sync_cli_verbose_passes_verbosity_override(monkeypatch) -> None:
 
 def test_sync_cli_compact_passes_verbosity_override(monkeypatch) -> None:
     mock_sync_command = Mock()
-    monkeypatch.setattr(cli_app_module, "sync_command", mock_sync_command)
+    monkeypatch.setattr(sync_command_module, "sync_command", mock_sync_command)
     runner = CliRunner()
     result = runner.invoke(app, ["sync", "--compact"])
 
@@ -321,15 +321,14 @@ def test_sync_rejects_state_reason_without_closed_state(tmp_path, monkeypatch) -
     assert "state_reason requires state='closed'" in result.output
 
 
-@patch("planhub.cli.commands.issue.datetime")
+@patch("planhub.cli.commands.issue.time")
 @patch("planhub.cli.commands.issue.get_github_repo_from_git")
 @patch("planhub.cli.commands.issue.get_auth_token")
-@patch("planhub.cli.commands.issue.GitHubClient")
+@patch("planhub.github.GitHubClient")
 def test_issue_command_success(
-    mock_client, mock_token, mock_repo, mock_datetime, tmp_path, monkeypatch
+    mock_client, mock_token, mock_repo, mock_time, tmp_path, monkeypatch
 ) -> None:
-    mock_now = mock_datetime.now.return_value
-    mock_now.strftime.return_value = "20240115"
+    mock_time.strftime.return_value = "20240115"
     mock_token.return_value = "token"
     mock_repo.return_value = ("acme", "roadmap")
     mock_client.return_value.create_issue.return_value = {
@@ -389,15 +388,14 @@ def test_issue_command_no_git_remote(mock_token, mock_repo, tmp_path, monkeypatc
     assert "Missing git remote origin URL" in result.output
 
 
-@patch("planhub.cli.commands.issue.datetime")
+@patch("planhub.cli.commands.issue.time")
 @patch("planhub.cli.commands.issue.get_github_repo_from_git")
 @patch("planhub.cli.commands.issue.get_auth_token")
-@patch("planhub.cli.commands.issue.GitHubClient")
+@patch("planhub.github.GitHubClient")
 def test_issue_command_handles_filename_conflicts(
-    mock_client, mock_token, mock_repo, mock_datetime, tmp_path, monkeypatch
+    mock_client, mock_token, mock_repo, mock_time, tmp_path, monkeypatch
 ) -> None:
-    mock_now = mock_datetime.now.return_value
-    mock_now.strftime.return_value = "20240115"
+    mock_time.strftime.return_value = "20240115"
     mock_token.return_value = "token"
     mock_repo.return_value = ("acme", "roadmap")
 
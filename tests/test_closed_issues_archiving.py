@@ -8,9 +8,9 @@ from planhub.cli.app import app
 from planhub.layout import ensure_layout
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_keeps_closed_issue_inside_open_milestone_directory(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -57,9 +57,9 @@ def test_sync_keeps_closed_issue_inside_open_milestone_directory(
     assert not archived.exists()
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_moves_closed_milestone_directory_to_archive(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -95,9 +95,9 @@ def test_sync_moves_closed_milestone_directory_to_archive(
     assert (archived_milestone_dir / "issues" / "issue.md").exists()
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_moves_reopened_milestone_directory_back_to_active(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -132,9 +132,9 @@ def test_sync_moves_reopened_milestone_directory_back_to_active(
     assert not archived_milestone_dir.exists()
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_deletes_closed_issue_when_policy_delete(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from planhub.documents import (
@@ -43,6 +45,33 @@ def test_load_issue_document_parses_fields(tmp_path) -> None:
     assert "Details here." in issue.body
 
 
+def test_load_issue_document_reuses_parse_until_file_changes(tmp_path) -> None:
+    issue_path = tmp_path / "issue.md"
+    issue_path.write_text('---\ntitle: "Ship it"\n---\n', encoding="utf-8")
+
+    first = load_issue_document(issue_path)
+    assert load_issue_document(issue_path) is first
+
+    issue_path.write_text('---\ntitle: "Ship it now"\n---\n', encoding="utf-8")
+
+    assert load_issue_document(issue_path).title == "Ship it now"
+
+
+def test_load_issue_document_sees_same_size_rewrite_within_one_mtime_tick(tmp_path) -> None:
+    issue_path = tmp_path / "issue.md"
+    issue_path.write_text('---\ntitle: "Ship it"\n---\n', encoding="utf-8")
+    update_front_matter(issue_path, {"milestone": 3})
+    stat = issue_path.stat()
+    assert load_issue_document(issue_path).milestone_number == 3
+
+    assert update_front_matter(issue_path, {"milestone": 4})
+    # Simulate a coarse filesystem clock: same size, same mtime.
+    os.utime(issue_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert issue_path.stat().st_size == stat.st_size
+
+    assert load_issue_document(issue_path).milestone_number == 4
+
+
 def test_load_milestone_document_uses_body_for_description(tmp_path) -> None:
     milestone_path = tmp_path / "milestone.md"
     milestone_path.write_text(
@@ -72,6 +101,24 @@ def test_load_issue_document_requires_title(tmp_path) -> None:
         load_issue_document(issue_path)
 
 
+def test_load_issue_document_handles_crlf_line_endings(tmp_path) -> None:
+    issue_path = tmp_path / "issue.md"
+    issue_path.write_bytes(b'---\r\ntitle: "Ship it"\r\n---\r\n\r\nLine one\r\nLine two\r\n')
+
+    issue = load_issue_document(issue_path)
+
+    assert issue.title == "Ship it"
+    assert issue.body == "Line one\nLine two"
+
+
+def test_load_issue_document_requires_closing_delimiter(tmp_path) -> None:
+    issue_path = tmp_path / "issue.md"
+    issue_path.write_text('---\ntitle: "Ship it"\n\nBody\n', encoding="utf-8")
+
+    with pytest.raises(DocumentError, match="Missing closing front matter delimiter"):
+        load_issue_document(issue_path)
+
+
 def test_update_front_matter_preserves_body(tmp_path) -> None:
     issue_path = tmp_path / "issue.md"
     issue_path.write_text(
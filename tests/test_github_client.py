@@ -1,4 +1,7 @@
 import json
+import os
+import time
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -8,6 +11,8 @@ from planhub.github import (
     GitHubClient,
     IssueState,
     IssueStateReason,
+    ResponseCache,
+    default_response_cache,
 )
 
 
@@ -42,8 +47,9 @@ def test_create_issue_builds_request() -> None:
         "body": "Details",
         "labels": ["p1"],
     }
-    # Verify headers were set on session
-    assert mock_session.headers.update.called
+    # Verify headers were set on the session once, not per request
+    mock_session.headers.update.assert_called_once()
+    assert call_kwargs["headers"] is None
 
 
 def test_request_surfaces_github_error() -> None:
@@ -197,8 +203,212 @@ def test_rate_limit_retries_after_reset() -> None:
 
     client = GitHubClient(token="token-123", session=mock_session)
 
-    with patch("planhub.github.time.time", return_value=99):
+    with (
+        patch("planhub.github.time.time", return_value=99),
+        patch("planhub.github.time.sleep") as mock_sleep,
+    ):
         payload = client.create_issue("acme", "roadmap", "Ship it")
 
     assert payload["id"] == 1
     assert mock_session.request.call_count == 2
+    mock_sleep.assert_called_once_with(2)
+
+
+def test_list_issues_revalidates_cached_response(tmp_path) -> None:
+    mock_session = MagicMock()
+    mock_session.request.side_effect = [
+        _create_mock_response([{"id": 1}], headers={"ETag": '"abc"'}),
+        _create_mock_response({}, status_code=304),
+    ]
+
+    client = GitHubClient(
+        token="token-123", session=mock_session, cache=ResponseCache(tmp_path / "cache")
+    )
+    first = client.list_issues("acme", "roadmap", state="all")
+    second = client.list_issues("acme", "roadmap", state="all")
+
+    assert first == second == [{"id": 1}]
+    assert mock_session.request.call_args_list[0].kwargs["headers"] is None
+    assert mock_session.request.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+
+def test_response_cache_is_not_shared_between_tokens(tmp_path) -> None:
+    cache = ResponseCache(tmp_path)
+    first_session = MagicMock()
+    first_session.request.return_value = _create_mock_response(
+        [{"id": 1}], headers={"ETag": '"abc"'}
+    )
+    GitHubClient(token="token-a", session=first_session, cache=cache).list_issues(
+        "acme", "roadmap", state="all"
+    )
+
+    second_session = MagicMock()
+    second_session.request.return_value = _create_mock_response(
+        [{"id": 2}], headers={"ETag": '"def"'}
+    )
+    issues = GitHubClient(token="token-b", session=second_session, cache=cache).list_issues(
+        "acme", "roadmap", state="all"
+    )
+
+    assert issues == [{"id": 2}]
+    assert second_session.request.call_args.kwargs["headers"] is None
+
+
+def test_response_cache_treats_malformed_and_expired_entries_as_misses(tmp_path) -> None:
+    cache = ResponseCache(tmp_path, max_age_seconds=60)
+    url = "https://api.github.com/repos/acme/roadmap/issues"
+    cache.put(url, '"abc"', [{"id": 1}], {"ETag": '"abc"'})
+    assert cache.get(url) == ('"abc"', [{"id": 1}], {"ETag": '"abc"'})
+
+    entry_path = next(tmp_path.glob("*.json"))
+    entry_path.write_text(json.dumps({"url": url, "etag": '"abc"'}), encoding="utf-8")
+    assert cache.get(url) is None
+
+    cache.put(url, '"abc"', [{"id": 1}], {})
+    with patch("planhub.github.time.time", return_value=time.time() + 120):
+        assert cache.get(url) is None
+
+
+def test_response_cache_prunes_oldest_entries_over_budget(tmp_path) -> None:
+    for index in range(3):
+        older = tmp_path / f"older-{index}.json"
+        older.write_text("x" * 100, encoding="utf-8")
+        modified = time.time() - 300 + index
+        os.utime(older, (modified, modified))
+    cache = ResponseCache(tmp_path, max_bytes=250)
+
+    cache.put("https://api.github.com/repos/acme/roadmap/issues", '"abc"', [], {})
+
+    assert sorted(path.name for path in tmp_path.glob("older-*.json")) == [
+        "older-1.json",
+        "older-2.json",
+    ]
+
+
+def test_default_response_cache_honours_xdg_cache_home(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    url = "https://api.github.com/repos/acme/roadmap/issues"
+
+    default_response_cache().put(url, '"abc"', [], {})
+
+    assert list((tmp_path / "xdg" / "planhub" / "github").glob("*.json"))
+
+
+def test_client_tracks_rate_limit_remaining() -> None:
+    mock_session = MagicMock()
+    mock_session.request.return_value = _create_mock_response(
+        {"id": 1}, headers={"X-RateLimit-Remaining": "42"}
+    )
+
+    client = GitHubClient(token="token-123", session=mock_session)
+    assert client.rate_limit_remaining is None
+
+    client.create_issue("acme", "roadmap", "Ship it")
+
+    assert client.rate_limit_remaining == 42
+
+
+def test_secondary_rate_limit_waits_for_retry_after() -> None:
+    mock_session = MagicMock()
+    mock_session.request.side_effect = [
+        _create_mock_response(
+            {"message": "You have exceeded a secondary rate limit"},
+            status_code=403,
+            headers={"X-RateLimit-Remaining": "4000", "Retry-After": "3"},
+        ),
+        _create_mock_response({"id": 1}, status_code=201),
+    ]
+
+    client = GitHubClient(token="token-123", session=mock_session)
+
+    with patch("planhub.github.time.sleep") as mock_sleep:
+        payload = client.create_issue("acme", "roadmap", "Ship it")
+
+    assert payload["id"] == 1
+    mock_sleep.assert_called_once_with(3)
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "expected_wait"),
+    [
+        # HTTP-date form, 10 seconds after the frozen clock below.
+        ("Thu, 01 Jan 2026 00:00:10 GMT", 10),
+        ("not a date", 60),
+    ],
+)
+def test_rate_limit_accepts_non_numeric_retry_after(retry_after, expected_wait) -> None:
+    mock_session = MagicMock()
+    mock_session.request.side_effect = [
+        _create_mock_response(
+            {"message": "Too many requests"},
+            status_code=429,
+            headers={"Retry-After": retry_after},
+        ),
+        _create_mock_response({"id": 1}, status_code=201),
+    ]
+
+    client = GitHubClient(token="token-123", session=mock_session)
+
+    with (
+        patch("planhub.github.datetime") as mock_datetime,
+        patch("planhub.github.time.sleep") as mock_sleep,
+    ):
+        mock_datetime.now.return_value = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        payload = client.create_issue("acme", "roadmap", "Ship it")
+
+    assert payload["id"] == 1
+    mock_sleep.assert_called_once_with(expected_wait)
+
+
+def test_repeated_rate_limits_give_up_after_retries() -> None:
+    mock_session = MagicMock()
+    mock_session.request.return_value = _create_mock_response(
+        {"message": "Too many requests"}, status_code=429, headers={"Retry-After": "1"}
+    )
+
+    client = GitHubClient(token="token-123", session=mock_session)
+
+    with patch("planhub.github.time.sleep"), pytest.raises(GitHubAPIError) as excinfo:
+        client.create_issue("acme", "roadmap", "Ship it")
+
+    assert excinfo.value.status_code == 429
+    assert mock_session.request.call_count == 4
+
+
+def test_list_issues_fetches_remaining_pages_when_last_page_is_known() -> None:
+    link = (
+        '<https://api.github.com/repositories/1/issues?state=all&per_page=100&page=2>; rel="next", '
+        '<https://api.github.com/repositories/1/issues?state=all&per_page=100&page=3>; rel="last"'
+    )
+
+    def respond(*, method, url, json, headers, timeout):
+        page = int(url.rsplit("page=", 1)[1])
+        return _create_mock_response([{"id": page}], headers={"Link": link} if page == 1 else {})
+
+    mock_session = MagicMock()
+    mock_session.request.side_effect = respond
+
+    client = GitHubClient(token="token-123", session=mock_session)
+    issues = client.list_issues("acme", "roadmap", state="all")
+
+    assert [issue["id"] for issue in issues] == [1, 2, 3]
+    assert mock_session.request.call_count == 3
+
+
+def test_exhausted_budget_waits_for_reset_before_next_request() -> None:
+    mock_session = MagicMock()
+    mock_session.request.return_value = _create_mock_response(
+        {"id": 1}, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "105"}
+    )
+
+    client = GitHubClient(token="token-123", session=mock_session)
+
+    with (
+        patch("planhub.github.time.time", return_value=100),
+        patch("planhub.github.time.sleep") as mock_sleep,
+    ):
+        client.create_issue("acme", "roadmap", "First")
+        mock_sleep.assert_not_called()
+        client.create_issue("acme", "roadmap", "Second")
+
+    mock_sleep.assert_called_once_with(6)
@@ -217,3 +217,118 @@ def test_import_creates_reopened_issues(tmp_path) -> None:
     reopened_issue = load_issue_document(layout.issues_dir / "20260127-reopened-issue.md")
     assert reopened_issue.title == "Reopened issue"
     assert reopened_issue.number == 6
+
+
+def test_import_suffixes_colliding_file_names(tmp_path) -> None:
+    issues = [
+        {
+            "number": number,
+            "title": "Same title",
+            "body": f"Body {number}",
+            "state": "open",
+            "created_at": "2026-01-27T10:00:00Z",
+            "labels": [],
+            "assignees": [],
+        }
+        for number in (7, 8)
+    ]
+    layout = ensure_layout(tmp_path)
+    (layout.issues_dir / "20260127-same-title-8.md").write_text("taken", encoding="utf-8")
+
+    result = import_existing_issues(
+        layout,
+        "acme",
+        "roadmap",
+        client=DummyClient(issues),
+        dry_run=False,
+    )
+
+    assert result.issues_created == 2
+    assert load_issue_document(layout.issues_dir / "20260127-same-title.md").number == 7
+    assert load_issue_document(layout.issues_dir / "20260127-same-title-2.md").number == 8
+
+
+def test_import_does_not_overwrite_issue_moved_into_milestone(tmp_path) -> None:
+    milestone = {"title": "M1", "number": 1, "state": "open"}
+
+    def issue(number: int, title: str) -> dict:
+        return {
+            "number": number,
+            "title": title,
+            "body": f"Body {number}",
+            "state": "open",
+            "created_at": "2024-01-05T10:00:00Z",
+            "milestone": milestone,
+        }
+
+    issues = [issue(1, "Other"), issue(2, "Update deps"), issue(3, "Update deps")]
+    layout = ensure_layout(tmp_path)
+    (layout.issues_dir / "20240105-update-deps.md").write_text(
+        '---\ntitle: "Update deps"\nnumber: 2\n---\n\nLocal notes\n', encoding="utf-8"
+    )
+
+    result = import_existing_issues(
+        layout,
+        "acme",
+        "roadmap",
+        client=DummyClient(issues),
+        dry_run=False,
+    )
+
+    issues_dir = layout.milestones_dir / "m1" / "issues"
+    assert result.issues_moved == 1
+    moved = load_issue_document(issues_dir / "20240105-update-deps.md")
+    assert moved.number == 2
+    assert moved.body == "Local notes"
+    assert load_issue_document(issues_dir / "20240105-update-deps-3.md").number == 3
+
+
+def test_import_file_names_collide_case_insensitively(tmp_path) -> None:
+    issues = [
+        {
+            "number": 4,
+            "title": "Fix bug",
+            "state": "open",
+            "created_at": "2026-01-27T10:00:00Z",
+        }
+    ]
+    layout = ensure_layout(tmp_path)
+    (layout.issues_dir / "20260127-FIX-BUG.md").write_text("taken", encoding="utf-8")
+
+    import_existing_issues(
+        layout,
+        "acme",
+        "roadmap",
+        client=DummyClient(issues),
+        dry_run=False,
+    )
+
+    assert load_issue_document(layout.issues_dir / "20260127-fix-bug-4.md").number == 4
+    assert (layout.issues_dir / "20260127-FIX-BUG.md").read_text(encoding="utf-8") == "taken"
+
+
+def test_import_dry_run_counts_each_milestone_once(tmp_path) -> None:
+    milestone = {"title": "Stage 1", "number": 5, "state": "open"}
+    issues = [
+        {
+            "number": number,
+            "title": f"Issue {number}",
+            "state": "open",
+            "created_at": "2026-01-27T08:00:00Z",
+            "milestone": milestone,
+        }
+        for number in (1, 2, 3)
+    ]
+    layout = ensure_layout(tmp_path)
+
+    result = import_existing_issues(
+        layout,
+        "acme",
+        "roadmap",
+        client=DummyClient(issues),
+        dry_run=True,
+    )
+
+    assert result.issues_created == 3
+    assert result.milestones_created == 1
+    assert not (layout.milestones_dir / "stage-1").exists()
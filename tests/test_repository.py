@@ -1,10 +1,17 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from planhub.repository import get_github_repo_from_git, parse_github_remote
 
 
+@pytest.fixture(autouse=True)
+def _no_git_subprocess(monkeypatch):
+    # Tests that need `git config` output patch it themselves; never fork a real git.
+    failed = MagicMock(returncode=1, stdout="")
+    monkeypatch.setattr("planhub.repository.subprocess.run", MagicMock(return_value=failed))
+
+
 def test_parse_github_remote_supports_https_and_ssh() -> None:
     assert parse_github_remote("https://github.com/acme/roadmap") == ("acme", "roadmap")
     assert parse_github_remote("https://www.github.com/acme/roadmap") == (
@@ -34,3 +41,55 @@ def test_get_github_repo_from_git_errors_on_missing_remote(mock_run, tmp_path) -
 
     with pytest.raises(ValueError, match="Missing git remote origin URL"):
         get_github_repo_from_git(tmp_path)
+
+
+@patch("planhub.repository.subprocess.run")
+def test_get_github_repo_from_git_reads_config_file(mock_run, tmp_path) -> None:
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "config").write_text(
+        "[core]\n"
+        "\tbare = false\n"
+        '[remote "upstream"]\n'
+        "\turl = https://github.com/other/roadmap\n"
+        '[remote "origin"]\n'
+        "\turl = git@github.com:acme/roadmap.git\n"
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n",
+        encoding="utf-8",
+    )
+
+    assert get_github_repo_from_git(tmp_path) == ("acme", "roadmap")
+    mock_run.assert_not_called()
+
+
+@patch("planhub.repository.subprocess.run")
+def test_get_github_repo_from_git_follows_worktree_pointer(mock_run, tmp_path) -> None:
+    main_git_dir = tmp_path / "main" / ".git"
+    worktree_git_dir = main_git_dir / "worktrees" / "feature"
+    worktree_git_dir.mkdir(parents=True)
+    (worktree_git_dir / "commondir").write_text("../..\n", encoding="utf-8")
+    (main_git_dir / "config").write_text(
+        '[remote "origin"]\n\turl = https://github.com/acme/roadmap.git\n',
+        encoding="utf-8",
+    )
+    worktree = tmp_path / "feature"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {worktree_git_dir}\n", encoding="utf-8")
+
+    assert get_github_repo_from_git(worktree) == ("acme", "roadmap")
+    mock_run.assert_not_called()
+
+
+@patch("planhub.repository.subprocess.run")
+def test_get_github_repo_from_git_caches_lookup(mock_run, tmp_path) -> None:
+    mock_run.return_value.returncode = 0
+    mock_run.return_value.stdout = "https://github.com/acme/roadmap\n"
+
+    assert get_github_repo_from_git(tmp_path) == ("acme", "roadmap")
+    assert get_github_repo_from_git(tmp_path / ".") == ("acme", "roadmap")
+    mock_run.assert_called_once()
+
+
+def test_get_github_repo_from_git_errors_without_git_dir(tmp_path) -> None:
+    with pytest.raises(ValueError, match="Missing git remote origin URL"):
+        get_github_repo_from_git(tmp_path)
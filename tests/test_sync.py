@@ -7,9 +7,9 @@ from planhub.documents import load_issue_document, load_milestone_document
 from planhub.layout import ensure_layout
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_creates_missing_issue_and_milestone(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -48,9 +48,156 @@ def test_sync_creates_missing_issue_and_milestone(
     client_instance.update_issue_state.assert_not_called()
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
+def test_sync_write_back_keeps_unmodelled_front_matter(
+    mock_client, mock_token, mock_repo, tmp_path, monkeypatch
+) -> None:
+    mock_token.return_value = "token"
+    mock_repo.return_value = ("acme", "roadmap")
+    mock_client.return_value.create_issue.return_value = {"number": 21, "state": "open"}
+
+    layout = ensure_layout(tmp_path)
+    issue_path = layout.issues_dir / "issue-001.md"
+    issue_path.write_text('---\ntitle: "Ship it"\npriority: high\n---\n', encoding="utf-8")
+
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(app, ["sync"])
+
+    assert result.exit_code == 0
+    assert "priority: high" in issue_path.read_text(encoding="utf-8")
+    assert load_issue_document(issue_path).number == 21
+
+
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
+def test_sync_skips_update_for_unchanged_issues(
+    mock_client, mock_token, mock_repo, tmp_path, monkeypatch
+) -> None:
+    mock_token.return_value = "token"
+    mock_repo.return_value = ("acme", "roadmap")
+    client_instance = mock_client.return_value
+    client_instance.list_issues.return_value = [
+        {
+            "number": 1,
+            "title": "Same",
+            "body": "Body",
+            "state": "open",
+            "labels": [{"name": "p1"}],
+            "assignees": [{"login": "alice"}],
+        },
+        {"number": 2, "title": "Old title", "body": "Body", "state": "open"},
+    ]
+    client_instance.update_issue.return_value = {"state": "open"}
+
+    layout = ensure_layout(tmp_path)
+    (layout.issues_dir / "same.md").write_text(
+        '---\ntitle: "Same"\nnumber: 1\nlabels: [p1]\nassignees: [alice]\n---\n\nBody\n',
+        encoding="utf-8",
+    )
+    (layout.issues_dir / "changed.md").write_text(
+        '---\ntitle: "New title"\nnumber: 2\n---\n\nBody\n',
+        encoding="utf-8",
+    )
+
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(app, ["sync"])
+
+    assert result.exit_code == 0
+    # The import's listing doubles as the change-detection snapshot.
+    client_instance.list_issues.assert_called_once_with("acme", "roadmap", state="all")
+    client_instance.update_issue.assert_called_once()
+    assert client_instance.update_issue.call_args.args[2] == 2
+
+
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
+def test_sync_keeps_unchanged_issue_in_renamed_milestone(
+    mock_client, mock_token, mock_repo, tmp_path, monkeypatch
+) -> None:
+    mock_token.return_value = "token"
+    mock_repo.return_value = ("acme", "roadmap")
+    client_instance = mock_client.return_value
+    client_instance.list_issues.return_value = [
+        {
+            "number": 1,
+            "title": "Same",
+            "body": "Body",
+            "state": "open",
+            "milestone": {"number": 5, "title": "Old name"},
+        }
+    ]
+    client_instance.list_milestones.return_value = [{"number": 5, "title": "Old name"}]
+    client_instance.update_milestone.return_value = {"number": 5, "title": "New name"}
+
+    layout = ensure_layout(tmp_path)
+    milestone_dir = layout.milestones_dir / "new-name"
+    (milestone_dir / "issues").mkdir(parents=True)
+    (milestone_dir / "milestone.md").write_text(
+        '---\ntitle: "New name"\nnumber: 5\n---\n', encoding="utf-8"
+    )
+    issue_path = milestone_dir / "issues" / "same.md"
+    issue_path.write_text(
+        '---\ntitle: "Same"\nnumber: 1\nmilestone: 5\n---\n\nBody\n', encoding="utf-8"
+    )
+
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(app, ["sync"])
+
+    assert result.exit_code == 0
+    client_instance.update_issue.assert_not_called()
+    # The snapshot predates the rename; the issue follows the renamed milestone.
+    assert issue_path.exists()
+    assert load_milestone_document(milestone_dir / "milestone.md").title == "New name"
+
+
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
+def test_sync_creates_milestones_before_their_issues(
+    mock_client, mock_token, mock_repo, tmp_path, monkeypatch
+) -> None:
+    mock_token.return_value = "token"
+    mock_repo.return_value = ("acme", "roadmap")
+    client_instance = mock_client.return_value
+    milestone_numbers = {"Stage 1": 7, "Stage 2": 8}
+    client_instance.create_milestone.side_effect = lambda owner, repo, title, **_: {
+        "number": milestone_numbers[title]
+    }
+    client_instance.create_issue.return_value = {"number": 21, "state": "open"}
+
+    layout = ensure_layout(tmp_path)
+    for slug, title in (("stage-1", "Stage 1"), ("stage-2", "Stage 2")):
+        milestone_dir = layout.milestones_dir / slug
+        (milestone_dir / "issues").mkdir(parents=True, exist_ok=True)
+        (milestone_dir / "milestone.md").write_text(
+            f'---\ntitle: "{title}"\n---\n',
+            encoding="utf-8",
+        )
+        (milestone_dir / "issues" / "issue.md").write_text(
+            f'---\ntitle: "Ship {title}"\n---\n',
+            encoding="utf-8",
+        )
+
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(app, ["sync"])
+
+    assert result.exit_code == 0
+    assert client_instance.create_milestone.call_count == 2
+    milestones_by_title = {
+        call.args[2]: call.kwargs["milestone"]
+        for call in client_instance.create_issue.call_args_list
+    }
+    assert milestones_by_title == {"Ship Stage 1": 7, "Ship Stage 2": 8}
+
+
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_updates_existing_issue(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -83,9 +230,9 @@ def test_sync_updates_existing_issue(
     assert issue.state_reason.value == "completed"
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_ignores_unknown_state_reason_from_github(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -113,9 +260,9 @@ def test_sync_ignores_unknown_state_reason_from_github(
     assert issue.state_reason is None
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_clears_labels_assignees_and_milestone(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -149,15 +296,15 @@ def test_sync_clears_labels_assignees_and_milestone(
 
     assert result.exit_code == 0
     kwargs = client_instance.update_issue.call_args.kwargs
-    assert kwargs["labels"] == []
-    assert kwargs["assignees"] == []
+    assert kwargs["labels"] == ()
+    assert kwargs["assignees"] == ()
     assert "milestone" not in kwargs
     assert "clear_milestone" not in kwargs
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_moves_root_issue_to_github_milestone(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -213,9 +360,9 @@ def test_sync_moves_root_issue_to_github_milestone(
     assert moved_issue.milestone_number == 7
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_moves_milestone_issue_back_to_root_if_github_removes_milestone(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -271,9 +418,9 @@ def test_sync_moves_milestone_issue_back_to_root_if_github_removes_milestone(
     assert moved_issue.milestone is None
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_create_uses_config_defaults_for_unset_labels_and_assignees(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -305,13 +452,13 @@ def test_sync_create_uses_config_defaults_for_unset_labels_and_assignees(
 
     assert result.exit_code == 0
     kwargs = client_instance.create_issue.call_args.kwargs
-    assert kwargs["labels"] == ["bug", "backend"]
-    assert kwargs["assignees"] == ["alice", "bob"]
+    assert kwargs["labels"] == ("bug", "backend")
+    assert kwargs["assignees"] == ("alice", "bob")
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_update_uses_config_defaults_for_unset_labels_and_assignees(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -345,13 +492,13 @@ def test_sync_update_uses_config_defaults_for_unset_labels_and_assignees(
 
     assert result.exit_code == 0
     kwargs = client_instance.update_issue.call_args.kwargs
-    assert kwargs["labels"] == ["bug", "backend"]
-    assert kwargs["assignees"] == ["alice", "bob"]
+    assert kwargs["labels"] == ("bug", "backend")
+    assert kwargs["assignees"] == ("alice", "bob")
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_does_not_move_if_issue_already_in_target_milestone(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -398,9 +545,9 @@ def test_sync_does_not_move_if_issue_already_in_target_milestone(
     assert not (layout.issues_dir / issue_path.name).exists()
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_creates_missing_milestone_dir_from_github(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -447,9 +594,9 @@ def test_sync_creates_missing_milestone_dir_from_github(
     assert not issue_path.exists()
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_creates_milestone_md_with_details_from_github(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -502,9 +649,9 @@ def test_sync_creates_milestone_md_with_details_from_github(
     assert milestone_doc.due_on == "2026-03-27T12:00:00Z"
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_does_not_overwrite_existing_milestone_md(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -569,9 +716,9 @@ def test_sync_does_not_overwrite_existing_milestone_md(
     assert milestone_md_path.read_text(encoding="utf-8") == original_text
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_slugifies_milestone_title_for_folder_name(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -611,9 +758,9 @@ def test_sync_slugifies_milestone_title_for_folder_name(
     assert moved_issue_path.exists()
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_milestone_when_title_missing_uses_number_slug(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -656,9 +803,9 @@ def test_sync_milestone_when_title_missing_uses_number_slug(
     assert moved_issue.milestone_number == 7
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_milestone_number_as_string_uses_title_in_front_matter(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -707,9 +854,9 @@ def test_sync_milestone_number_as_string_uses_title_in_front_matter(
     assert moved_issue.milestone_number is None
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_moves_multiple_issues_to_distinct_milestones(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -784,9 +931,9 @@ def test_sync_moves_multiple_issues_to_distinct_milestones(
     assert not issue2_path.exists()
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_milestone_move_collision_adds_numeric_suffix(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -843,9 +990,9 @@ def test_sync_milestone_move_collision_adds_numeric_suffix(
     assert (issues_dir / "issue-1.md").exists()
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_does_not_relocate_when_github_milestone_field_missing(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -892,9 +1039,9 @@ def test_sync_does_not_relocate_when_github_milestone_field_missing(
     assert not (layout.issues_dir / issue_path.name).exists()
 
 
-@patch("planhub.cli.commands.sync.get_github_repo_from_git")
-@patch("planhub.cli.commands.sync.get_auth_token")
-@patch("planhub.cli.commands.sync.GitHubClient")
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
 def test_sync_parallel_moves_same_filename_to_root_are_collision_safe(
     mock_client, mock_token, mock_repo, tmp_path, monkeypatch
 ) -> None:
@@ -938,3 +1085,47 @@ def test_sync_parallel_moves_same_filename_to_root_are_collision_safe(
     assert result.exit_code == 0
     assert (layout.issues_dir / "issue.md").exists()
     assert (layout.issues_dir / "issue-1.md").exists()
+
+
+@patch("planhub.repository.get_github_repo_from_git")
+@patch("planhub.auth.get_auth_token")
+@patch("planhub.github.GitHubClient")
+def test_sync_reports_repeated_errors_once(
+    mock_client, mock_token, mock_repo, tmp_path, monkeypatch
+) -> None:
+    mock_token.return_value = "token"
+    mock_repo.return_value = ("acme", "roadmap")
+    client_instance = mock_client.return_value
+    client_instance.update_issue.side_effect = RuntimeError("Bad credentials")
+
+    layout = ensure_layout(tmp_path)
+    for number in (1, 2, 3):
+        (layout.issues_dir / f"issue-{number}.md").write_text(
+            f'---\ntitle: "Issue {number}"\nnumber: {number}\n---\n',
+            encoding="utf-8",
+        )
+
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(app, ["sync"])
+
+    assert result.exit_code == 1
+    assert client_instance.update_issue.call_count == 3
+    assert result.output.count("Parallel execution error: Bad credentials") == 1
+
+
+@patch("planhub.auth.get_auth_token", return_value=None)
+@patch("planhub.github.GitHubClient")
+def test_sync_empty_plan_does_not_create_client(
+    mock_client, mock_token, tmp_path, monkeypatch
+) -> None:
+    ensure_layout(tmp_path)
+
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(app, ["sync"])
+
+    assert result.exit_code == 0
+    assert "Sync completed" in result.output
+    mock_token.assert_called_once()
+    mock_client.assert_not_called()